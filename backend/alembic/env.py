@@ -82,6 +82,9 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # Migration DDL/data statements run once; don't keep them in the compiled cache
+        connection = connection.execution_options(compiled_cache=None)
+        
         context.configure(
             connection=connection, target_metadata=target_metadata
         )
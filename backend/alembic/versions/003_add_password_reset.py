@@ -17,18 +17,35 @@ depends_on = None
 
 
 def upgrade():
-    # Drop the plain text password column if it exists
-    try:
-        op.drop_column('users', 'password')
-    except:
-        pass
+    # Check which columns exist so the optional drop doesn't need a try/except
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = [col['name'] for col in inspector.get_columns('users')]
     
-    # Add password reset fields (without unique constraint for SQLite compatibility)
-    op.add_column('users', sa.Column('reset_token', sa.String(255), nullable=True))
-    op.add_column('users', sa.Column('reset_token_expiry', sa.DateTime, nullable=True))
+    if conn.dialect.name == 'postgresql':
+        # Commit each ALTER on its own so the users lock is released between steps
+        if 'password' in columns:
+            with op.get_context().autocommit_block():
+                op.drop_column('users', 'password')
+        with op.get_context().autocommit_block():
+            op.add_column('users', sa.Column('reset_token', sa.String(255), nullable=True))
+        with op.get_context().autocommit_block():
+            op.add_column('users', sa.Column('reset_token_expiry', sa.DateTime, nullable=True))
+        return
+    
+    # One batch so SQLite rebuilds the users table once instead of three times
+    with op.batch_alter_table('users') as batch_op:
+        # Drop the plain text password column if it exists
+        if 'password' in columns:
+            batch_op.drop_column('password')
+        
+        # Add password reset fields (without unique constraint for SQLite compatibility)
+        batch_op.add_column(sa.Column('reset_token', sa.String(255), nullable=True))
+        batch_op.add_column(sa.Column('reset_token_expiry', sa.DateTime, nullable=True))
 
 
 def downgrade():
     # Remove password reset fields
-    op.drop_column('users', 'reset_token')
-    op.drop_column('users', 'reset_token_expiry')
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('reset_token')
+        batch_op.drop_column('reset_token_expiry')
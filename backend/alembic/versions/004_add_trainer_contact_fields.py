@@ -18,13 +18,35 @@ depends_on = None
 
 def upgrade():
     # Add phone, cnic, and email columns to trainer_profiles table
-    op.add_column('trainer_profiles', sa.Column('phone', sa.String(20), nullable=True))
-    op.add_column('trainer_profiles', sa.Column('cnic', sa.String(20), nullable=True))
-    op.add_column('trainer_profiles', sa.Column('email', sa.String(100), nullable=True))
+    with op.batch_alter_table('trainer_profiles') as batch_op:
+        batch_op.add_column(sa.Column('phone', sa.String(20), nullable=True))
+        batch_op.add_column(sa.Column('cnic', sa.String(20), nullable=True))
+        batch_op.add_column(sa.Column('email', sa.String(100), nullable=True))
+    
+    # Index contact columns used for trainer search/lookup.
+    # Non-unique to match member_profiles after 013 (columns are optional).
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build concurrently so trainer_profiles stays writable during the build
+        with op.get_context().autocommit_block():
+            for column in ('phone', 'cnic', 'email'):
+                op.execute(
+                    f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trainer_profiles_{column} '
+                    f'ON trainer_profiles ({column})'
+                )
+    else:
+        for column in ('phone', 'cnic', 'email'):
+            op.create_index(f'ix_trainer_profiles_{column}', 'trainer_profiles', [column], unique=False)
 
 
 def downgrade():
+    # Remove contact indexes before dropping their columns
+    op.drop_index('ix_trainer_profiles_email', table_name='trainer_profiles')
+    op.drop_index('ix_trainer_profiles_cnic', table_name='trainer_profiles')
+    op.drop_index('ix_trainer_profiles_phone', table_name='trainer_profiles')
+    
     # Remove phone, cnic, and email columns from trainer_profiles table
-    op.drop_column('trainer_profiles', 'email')
-    op.drop_column('trainer_profiles', 'cnic')
-    op.drop_column('trainer_profiles', 'phone')
+    with op.batch_alter_table('trainer_profiles') as batch_op:
+        batch_op.drop_column('email')
+        batch_op.drop_column('cnic')
+        batch_op.drop_column('phone')
@@ -18,7 +18,7 @@ depends_on = None
 
 def upgrade():
     # Create settings table
-    op.create_table(
+    settings_table = op.create_table(
         'settings',
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('admission_fee', sa.Numeric(precision=10, scale=2), nullable=False, server_default='0'),
@@ -27,8 +27,9 @@ def upgrade():
         sa.PrimaryKeyConstraint('id')
     )
     
-    # Insert default settings row
-    op.execute("INSERT INTO settings (admission_fee) VALUES (0)")
+    # Insert default settings row. Seed/backfill data goes through bulk_insert so
+    # rows are sent as one bound executemany instead of one INSERT per row.
+    op.bulk_insert(settings_table, [{'admission_fee': 0}])
 
 
 def downgrade():
@@ -18,12 +18,14 @@ depends_on = None
 
 def upgrade():
     # Add gender, date_of_birth, and admission_date columns to member_profiles
-    op.add_column('member_profiles', sa.Column('gender', sa.String(10), nullable=True))
-    op.add_column('member_profiles', sa.Column('date_of_birth', sa.Date(), nullable=True))
-    op.add_column('member_profiles', sa.Column('admission_date', sa.Date(), nullable=True))
+    with op.batch_alter_table('member_profiles') as batch_op:
+        batch_op.add_column(sa.Column('gender', sa.String(10), nullable=True))
+        batch_op.add_column(sa.Column('date_of_birth', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('admission_date', sa.Date(), nullable=True))
 
 
 def downgrade():
-    op.drop_column('member_profiles', 'admission_date')
-    op.drop_column('member_profiles', 'date_of_birth')
-    op.drop_column('member_profiles', 'gender')
+    with op.batch_alter_table('member_profiles') as batch_op:
+        batch_op.drop_column('admission_date')
+        batch_op.drop_column('date_of_birth')
+        batch_op.drop_column('gender')
@@ -7,6 +7,7 @@ Create Date: 2026-02-06
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -15,12 +16,25 @@ down_revision = '006_add_member_personal_fields'
 branch_labels = None
 depends_on = None
 
+# Must match trainer_profiles.id (native uuid on PostgreSQL, see 001)
+UUIDType = postgresql.UUID(as_uuid=False).with_variant(sa.String(36), 'sqlite')
+
 
 def upgrade():
     # Add trainer_id column to member_profiles (SQLite doesn't support adding FK constraints directly)
-    op.add_column('member_profiles', sa.Column('trainer_id', sa.String(36), nullable=True))
+    op.add_column('member_profiles', sa.Column('trainer_id', UUIDType, nullable=True))
+    
+    # Index the FK so trainer -> members joins don't fall back to a sequential scan
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build concurrently so member_profiles stays writable during the build
+        with op.get_context().autocommit_block():
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_profiles_trainer_id ON member_profiles (trainer_id)')
+    else:
+        op.create_index('ix_member_profiles_trainer_id', 'member_profiles', ['trainer_id'], unique=False)
 
 
 def downgrade():
-    # Remove trainer_id column
+    # Remove trainer_id index and column
+    op.drop_index('ix_member_profiles_trainer_id', table_name='member_profiles')
     op.drop_column('member_profiles', 'trainer_id')
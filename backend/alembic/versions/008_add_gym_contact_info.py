@@ -18,11 +18,13 @@ depends_on = None
 
 def upgrade():
     # Add gym_address and gym_phone columns to settings table
-    op.add_column('settings', sa.Column('gym_address', sa.String(500), nullable=True))
-    op.add_column('settings', sa.Column('gym_phone', sa.String(50), nullable=True))
+    with op.batch_alter_table('settings') as batch_op:
+        batch_op.add_column(sa.Column('gym_address', sa.String(500), nullable=True))
+        batch_op.add_column(sa.Column('gym_phone', sa.String(50), nullable=True))
 
 
 def downgrade():
     # Remove gym_address and gym_phone columns
-    op.drop_column('settings', 'gym_phone')
-    op.drop_column('settings', 'gym_address')
+    with op.batch_alter_table('settings') as batch_op:
+        batch_op.drop_column('gym_phone')
+        batch_op.drop_column('gym_address')
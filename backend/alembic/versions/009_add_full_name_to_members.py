@@ -16,9 +16,29 @@ branch_labels = None
 depends_on = None
 
 
+def _backfill_full_name(batch=1000):
+    """Copy users.username into empty full_name values, committing every batch."""
+    conn = op.get_bind()
+    # Small committed batches keep row locks and WAL growth bounded on large tables
+    stmt = sa.text(
+        "UPDATE member_profiles SET full_name = "
+        "(SELECT username FROM users WHERE users.id = member_profiles.user_id) "
+        "WHERE id IN (SELECT mp.id FROM member_profiles mp JOIN users u ON u.id = mp.user_id "
+        "WHERE mp.full_name IS NULL LIMIT :batch)"
+    )
+    with op.get_context().autocommit_block():
+        while True:
+            rowcount = conn.execute(stmt, {'batch': batch}).rowcount
+            if rowcount < batch:
+                break
+
+
 def upgrade():
     # Add full_name column to member_profiles
     op.add_column('member_profiles', sa.Column('full_name', sa.String(100), nullable=True))
+    
+    # Populate existing members from their usernames
+    _backfill_full_name()
 
 
 def downgrade():
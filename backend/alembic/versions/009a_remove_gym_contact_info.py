@@ -18,8 +18,16 @@ depends_on = None
 
 def upgrade():
     # Remove gym_address and gym_phone columns from settings table
-    op.drop_column('settings', 'gym_phone')
-    op.drop_column('settings', 'gym_address')
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Commit each drop independently instead of holding one long DDL transaction
+        with op.get_context().autocommit_block():
+            op.drop_column('settings', 'gym_phone')
+        with op.get_context().autocommit_block():
+            op.drop_column('settings', 'gym_address')
+    else:
+        op.drop_column('settings', 'gym_phone')
+        op.drop_column('settings', 'gym_address')
 
 
 def downgrade():
@@ -18,11 +18,13 @@ depends_on = None
 
 def upgrade():
     # Add trainer_fee and discount_amount columns to transactions table
-    op.add_column('transactions', sa.Column('trainer_fee', sa.Numeric(10, 2), server_default='0', nullable=True))
-    op.add_column('transactions', sa.Column('discount_amount', sa.Numeric(10, 2), server_default='0', nullable=True))
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('trainer_fee', sa.Numeric(10, 2), server_default='0', nullable=True))
+        batch_op.add_column(sa.Column('discount_amount', sa.Numeric(10, 2), server_default='0', nullable=True))
 
 
 def downgrade():
     # Remove trainer_fee and discount_amount columns
-    op.drop_column('transactions', 'discount_amount')
-    op.drop_column('transactions', 'trainer_fee')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('discount_amount')
+        batch_op.drop_column('trainer_fee')
@@ -18,9 +18,11 @@ depends_on = None
 
 def upgrade():
     # Add discount_type column to transactions table
-    op.add_column('transactions', sa.Column('discount_type', sa.String(20), server_default='fixed', nullable=True))
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('discount_type', sa.String(20), server_default='fixed', nullable=True))
 
 
 def downgrade():
     # Remove discount_type column
-    op.drop_column('transactions', 'discount_type')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('discount_type')
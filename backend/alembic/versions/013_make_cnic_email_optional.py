@@ -7,7 +7,6 @@ Create Date: 2026-02-16
 """
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.engine.reflection import Inspector
 
 
 # revision identifiers, used by Alembic.
@@ -20,7 +19,7 @@ depends_on = None
 def upgrade():
     # Get connection and check database type
     conn = op.get_bind()
-    inspector = Inspector.from_engine(conn)
+    inspector = sa.inspect(conn)
     
     # Check if we're using PostgreSQL or SQLite
     if conn.dialect.name == 'postgresql':
@@ -37,15 +36,12 @@ def upgrade():
         op.execute('CREATE INDEX IF NOT EXISTS ix_member_profiles_email ON member_profiles(email);')
     else:
         # SQLite - constraints were already fixed manually
-        # Just ensure indexes exist
-        try:
+        # Just ensure indexes exist (checked up front instead of swallowing errors)
+        indexes = {idx['name'] for idx in inspector.get_indexes('member_profiles')}
+        if 'ix_member_profiles_cnic' not in indexes:
             op.create_index('ix_member_profiles_cnic', 'member_profiles', ['cnic'], unique=False)
-        except:
-            pass
-        try:
+        if 'ix_member_profiles_email' not in indexes:
             op.create_index('ix_member_profiles_email', 'member_profiles', ['email'], unique=False)
-        except:
-            pass
 
 
 def downgrade():
@@ -1,7 +1,7 @@
 """Add description field to transactions
 
 Revision ID: 019_add_transaction_description
-Revises: 018_add_transaction_reverse_fields
+Revises: 018
 Create Date: 2026-05-07 12:00:00.000000
 
 """
@@ -11,7 +11,7 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = '019_add_transaction_description'
-down_revision = '018_add_transaction_reverse_fields'
+down_revision = '018'
 branch_labels = None
 depends_on = None
 
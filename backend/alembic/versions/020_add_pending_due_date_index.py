@@ -0,0 +1,38 @@
+"""Add partial index on pending transactions by due date
+
+Revision ID: 020_add_pending_due_date_index
+Revises: 019_add_transaction_description
+Create Date: 2026-05-10 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020_add_pending_due_date_index'
+down_revision = '019_add_transaction_description'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Overdue scans only look at PENDING rows past due_date, so index just those
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build concurrently so transactions stays writable during the build
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_pending_due "
+                "ON transactions (due_date) WHERE status = 'PENDING'"
+            )
+    else:
+        # SQLite supports partial indexes as well
+        op.create_index(
+            'ix_transactions_pending_due', 'transactions', ['due_date'], unique=False,
+            sqlite_where=sa.text("status = 'PENDING'")
+        )
+
+
+def downgrade():
+    op.drop_index('ix_transactions_pending_due', table_name='transactions')
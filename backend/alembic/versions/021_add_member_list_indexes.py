@@ -0,0 +1,47 @@
+"""Add indexes for admin member list and filter queries
+
+Revision ID: 021_add_member_list_indexes
+Revises: 020_add_pending_due_date_index
+Create Date: 2026-05-12 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '021_add_member_list_indexes'
+down_revision = '020_add_pending_due_date_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build concurrently so member_profiles stays writable during the builds
+        with op.get_context().autocommit_block():
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_profiles_created_at ON member_profiles (created_at)')
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_profiles_trainer_frozen ON member_profiles (trainer_id, is_frozen)')
+            op.execute(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_profiles_expiry ON member_profiles (package_expiry_date) '
+                'WHERE package_expiry_date IS NOT NULL'
+            )
+            # The composite leads with trainer_id, so the FK index from 007 is redundant
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_member_profiles_trainer_id')
+    else:
+        op.create_index('ix_member_profiles_created_at', 'member_profiles', ['created_at'], unique=False)
+        op.create_index('ix_member_profiles_trainer_frozen', 'member_profiles', ['trainer_id', 'is_frozen'], unique=False)
+        op.create_index(
+            'ix_member_profiles_expiry', 'member_profiles', ['package_expiry_date'], unique=False,
+            sqlite_where=sa.text('package_expiry_date IS NOT NULL')
+        )
+        # The composite leads with trainer_id, so the FK index from 007 is redundant
+        op.drop_index('ix_member_profiles_trainer_id', table_name='member_profiles')
+
+
+def downgrade():
+    op.create_index('ix_member_profiles_trainer_id', 'member_profiles', ['trainer_id'], unique=False)
+    op.drop_index('ix_member_profiles_expiry', table_name='member_profiles')
+    op.drop_index('ix_member_profiles_trainer_frozen', table_name='member_profiles')
+    op.drop_index('ix_member_profiles_created_at', table_name='member_profiles')
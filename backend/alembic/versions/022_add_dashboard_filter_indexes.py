@@ -0,0 +1,37 @@
+"""Add composite indexes for dashboard and finance filters
+
+Revision ID: 022_add_dashboard_filter_indexes
+Revises: 021_add_member_list_indexes
+Create Date: 2026-05-14 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '022_add_dashboard_filter_indexes'
+down_revision = '021_add_member_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Revenue windows (status + paid_date), revenue projection (is_frozen +
+    # package) and member growth (role + created_at) become range scans
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build concurrently so the tables stay writable during the builds
+        with op.get_context().autocommit_block():
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_status_paid_date ON transactions (status, paid_date)')
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_profiles_frozen_package ON member_profiles (is_frozen, current_package_id)')
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_role_created_at ON users (role, created_at)')
+    else:
+        op.create_index('ix_transactions_status_paid_date', 'transactions', ['status', 'paid_date'], unique=False)
+        op.create_index('ix_member_profiles_frozen_package', 'member_profiles', ['is_frozen', 'current_package_id'], unique=False)
+        op.create_index('ix_users_role_created_at', 'users', ['role', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_users_role_created_at', table_name='users')
+    op.drop_index('ix_member_profiles_frozen_package', table_name='member_profiles')
+    op.drop_index('ix_transactions_status_paid_date', table_name='transactions')
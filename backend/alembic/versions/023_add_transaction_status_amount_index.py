@@ -0,0 +1,31 @@
+"""Add (status, amount) index for the finance report totals
+
+Revision ID: 023_add_transaction_status_amount_index
+Revises: 022_add_dashboard_filter_indexes
+Create Date: 2026-06-02 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '023_add_transaction_status_amount_index'
+down_revision = '022_add_dashboard_filter_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Per-status COUNT/SUM(amount) in the finance report is answered from the
+    # index alone (index-only scan) instead of reading every transaction row
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build concurrently so the table stays writable during the build
+        with op.get_context().autocommit_block():
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_status_amount ON transactions (status, amount)')
+    else:
+        op.create_index('ix_transactions_status_amount', 'transactions', ['status', 'amount'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_transactions_status_amount', table_name='transactions')
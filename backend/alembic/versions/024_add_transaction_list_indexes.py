@@ -0,0 +1,61 @@
+"""Add indexes for the finance list endpoints and members-by-package
+
+Revision ID: 024_add_transaction_list_indexes
+Revises: 023_add_transaction_status_amount_index
+Create Date: 2026-06-09 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '024_add_transaction_list_indexes'
+down_revision = '023_add_transaction_status_amount_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Transaction lists filter by status or member and sort newest first; the
+    # overdue list sorts OVERDUE rows by due_date; members-by-package filters
+    # on current_package_id. Each becomes an index range scan in sort order.
+    conn = op.get_bind()
+    if conn.dialect.name == 'postgresql':
+        # Build concurrently so the tables stay writable during the builds
+        with op.get_context().autocommit_block():
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_created_at ON transactions (created_at)')
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_status_created_at ON transactions (status, created_at)')
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_member_created_at ON transactions (member_id, created_at)')
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_overdue_due "
+                "ON transactions (due_date) WHERE status = 'OVERDUE'"
+            )
+            op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_profiles_current_package ON member_profiles (current_package_id)')
+            # (member_id, created_at) serves every member-led lookup; drop the
+            # two older member_id indexes from 001 so writes maintain one
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_member_id')
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_member_status')
+    else:
+        op.create_index('ix_transactions_created_at', 'transactions', ['created_at'], unique=False)
+        op.create_index('ix_transactions_status_created_at', 'transactions', ['status', 'created_at'], unique=False)
+        op.create_index('ix_transactions_member_created_at', 'transactions', ['member_id', 'created_at'], unique=False)
+        op.create_index(
+            'ix_transactions_overdue_due', 'transactions', ['due_date'], unique=False,
+            sqlite_where=sa.text("status = 'OVERDUE'")
+        )
+        op.create_index('ix_member_profiles_current_package', 'member_profiles', ['current_package_id'], unique=False)
+        # (member_id, created_at) serves every member-led lookup; drop the
+        # two older member_id indexes from 001 so writes maintain one
+        op.drop_index('ix_transactions_member_id', table_name='transactions')
+        op.drop_index('ix_transactions_member_status', table_name='transactions')
+
+
+def downgrade():
+    op.create_index('ix_transactions_member_status', 'transactions', ['member_id', 'status', 'due_date'], unique=False)
+    op.create_index('ix_transactions_member_id', 'transactions', ['member_id'], unique=False)
+    op.drop_index('ix_member_profiles_current_package', table_name='member_profiles')
+    op.drop_index('ix_transactions_overdue_due', table_name='transactions')
+    op.drop_index('ix_transactions_member_created_at', table_name='transactions')
+    op.drop_index('ix_transactions_status_created_at', table_name='transactions')
+    op.drop_index('ix_transactions_created_at', table_name='transactions')
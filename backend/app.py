@@ -26,6 +26,33 @@ jwt = JWTManager()
 socketio = SocketIO()
 mail = Mail()
 
+# CORS settings only depend on the environment, so build them once at import
+# instead of on every create_app() call (tests call the factory per test)
+_CORS_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+_CORS_ALLOW_HEADERS = ("Content-Type", "Authorization", "Cache-Control", "X-Requested-With")
+_CORS_EXPOSE_HEADERS = ("Content-Type", "Authorization")
+_CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://localhost:5173').split(',')
+    if origin.strip()
+)
+_CORS_RESOURCES_PRODUCTION = {r"/api/*": {
+    "origins": _CORS_ORIGINS,
+    "methods": _CORS_METHODS,
+    "allow_headers": _CORS_ALLOW_HEADERS,
+    "supports_credentials": True,
+    "expose_headers": _CORS_EXPOSE_HEADERS,
+    "max_age": 3600
+}}
+_CORS_RESOURCES_DEVELOPMENT = {r"/api/*": {
+    "origins": "*",
+    "methods": _CORS_METHODS,
+    "allow_headers": _CORS_ALLOW_HEADERS,
+    "supports_credentials": False,
+    "expose_headers": _CORS_EXPOSE_HEADERS,
+    "max_age": 3600
+}}
+
 
 def create_app(config=None):
     """Create and configure Flask application."""
@@ -39,6 +66,13 @@ def create_app(config=None):
         config = get_config()
     app.config.from_object(config)
     
+    # Serialize JSON responses with orjson when it is installed
+    try:
+        from utils.json_provider import ORJSONProvider
+        app.json = ORJSONProvider(app)
+    except ImportError:
+        pass
+    
     # Enable detailed logging
     import logging
     
@@ -50,7 +84,7 @@ def create_app(config=None):
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         app.logger.setLevel(logging.INFO)
-    else:
+    elif app.debug:
         logging.basicConfig(level=logging.DEBUG)
         app.logger.setLevel(logging.DEBUG)
     
@@ -71,30 +105,17 @@ def create_app(config=None):
                      engineio_logger=True)
     
     # Debug: Log email configuration
-    app.logger.info(f"MAIL_SERVER: {app.config.get('MAIL_SERVER')}")
-    app.logger.info(f"MAIL_USERNAME: {app.config.get('MAIL_USERNAME')}")
-    app.logger.info(f"MAIL_DEFAULT_SENDER: {app.config.get('MAIL_DEFAULT_SENDER')}")
-    app.logger.info(f"MAIL_PASSWORD: {'*' * len(app.config.get('MAIL_PASSWORD', '')) if app.config.get('MAIL_PASSWORD') else 'NOT SET'}")
+    app.logger.info("MAIL_SERVER: %s", app.config.get('MAIL_SERVER'))
+    app.logger.info("MAIL_USERNAME: %s", app.config.get('MAIL_USERNAME'))
+    app.logger.info("MAIL_DEFAULT_SENDER: %s", app.config.get('MAIL_DEFAULT_SENDER'))
+    app.logger.info("MAIL_PASSWORD: %s", '*' * len(app.config.get('MAIL_PASSWORD', '')) if app.config.get('MAIL_PASSWORD') else 'NOT SET')
     
     # Configure CORS - Production-ready with environment-based origins
-    allowed_origins = os.getenv('CORS_ORIGINS', 'http://localhost:3000,http://localhost:5173').split(',')
-    
-    # In production, use specific origins only
     if app.config.get('ENV') == 'production':
-        allowed_origins = [origin.strip() for origin in allowed_origins if origin.strip()]
+        CORS(app, resources=_CORS_RESOURCES_PRODUCTION)
     else:
-        # Development: allow localhost
-        allowed_origins = "*"
-    
-    CORS(app, 
-         resources={r"/api/*": {
-             "origins": allowed_origins,
-             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-             "allow_headers": ["Content-Type", "Authorization", "Cache-Control", "X-Requested-With"],
-             "supports_credentials": True if app.config.get('ENV') == 'production' else False,
-             "expose_headers": ["Content-Type", "Authorization"],
-             "max_age": 3600
-         }})
+        # Development: allow any origin
+        CORS(app, resources=_CORS_RESOURCES_DEVELOPMENT)
     
     # Register blueprints - Admin Only
     from routes.auth import auth_bp
@@ -106,25 +127,25 @@ def create_app(config=None):
         from routes.attendance import attendance_bp
         app.register_blueprint(attendance_bp, url_prefix='/api/attendance')
     except ImportError as e:
-        app.logger.warning(f"Could not import attendance blueprint: {e}")
+        app.logger.warning("Could not import attendance blueprint: %s", e)
     
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(admin_complete_bp, url_prefix='/api/admin')
     app.register_blueprint(finance_bp, url_prefix='/api/finance')
     app.register_blueprint(packages_bp, url_prefix='/api/packages')
     
-    # Add request logging (only in development)
-    if app.config.get('ENV') != 'production':
+    # Dashboard response cache; cleared after successful writes to the
+    # blueprints that own the cached data
+    from utils import response_cache
+    response_cache.init_app(app, blueprints=(admin_complete_bp.name, finance_bp.name, packages_bp.name))
+    
+    # Add request logging (only in debug mode)
+    if app.debug:
         @app.before_request
         def log_request():
-            app.logger.info(f"\n{'='*60}")
-            app.logger.info(f"INCOMING REQUEST:")
-            app.logger.info(f"Path: {request.path}")
-            app.logger.info(f"Method: {request.method}")
-            app.logger.info(f"Blueprint: {request.blueprint}")
-            app.logger.info(f"Endpoint: {request.endpoint}")
-            app.logger.info(f"Headers: {dict(request.headers)}")
-            app.logger.info(f"{'='*60}\n")
+            # Single lazily-formatted record; skipped entirely above DEBUG level
+            app.logger.debug("%s %s bp=%s ep=%s", request.method, request.path,
+                             request.blueprint, request.endpoint)
     
     # Add security headers
     @app.after_request
@@ -173,9 +194,11 @@ def create_app(config=None):
             'dirname': os.path.dirname(__file__)
         }), 200
     
-    # Serve frontend static files (must be after API routes)
-    @app.route('/', defaults={'path': ''})
-    @app.route('/<path:path>')
+    # Serve frontend static files (must be after API routes). No automatic
+    # OPTIONS here, so preflight to a path no API route serves is a 405
+    # instead of an empty 200
+    @app.route('/', defaults={'path': ''}, provide_automatic_options=False)
+    @app.route('/<path:path>', provide_automatic_options=False)
     def serve_frontend(path):
         """Serve frontend files for SPA routing."""
         from flask import send_from_directory
@@ -190,14 +213,16 @@ def create_app(config=None):
         project_root = os.path.dirname(backend_dir)
         frontend_dir = os.path.join(project_root, 'frontend', 'dist')
         
-        app.logger.info(f"Serving path: {path}")
-        app.logger.info(f"Frontend dir: {frontend_dir}")
+        # Lazy %-style args: nothing is formatted unless INFO is enabled
+        app.logger.info("Serving path: %s", path)
+        app.logger.info("Frontend dir: %s", frontend_dir)
         
         # Serve assets directory files directly with correct MIME types
         if path.startswith('assets/'):
             file_path = os.path.join(frontend_dir, path)
-            app.logger.info(f"Asset request: {file_path}, exists: {os.path.exists(file_path)}")
-            if os.path.exists(file_path):
+            asset_exists = os.path.exists(file_path)
+            app.logger.info("Asset request: %s, exists: %s", file_path, asset_exists)
+            if asset_exists:
                 return send_from_directory(frontend_dir, path)
             return jsonify({'error': 'Asset not found', 'path': path, 'full_path': file_path}), 404
         
@@ -217,9 +242,48 @@ def create_app(config=None):
     def not_found(error):
         return jsonify({'error': 'Not found', 'path': request.path}), 404
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Schema is managed by Alembic (run `alembic upgrade head` once per release).
+    # Running create_all here made every gunicorn worker race on DDL at boot.
+    migration_mode = app.config.get('MIGRATION_MODE', 'skip')
+    if migration_mode == 'async':
+        # Upgrade in the background so the health endpoint serves immediately
+        import shutil
+        import subprocess
+        import threading
+        
+        # Use the alembic console script: `python -m alembic` run from backend/
+        # resolves to this repo's alembic/ migrations package, not the library
+        alembic_bin = (
+            shutil.which('alembic', path=os.path.dirname(sys.executable))
+            or shutil.which('alembic')
+        )
+        with app.app_context():
+            # Migrate the database this app actually uses, not whatever env.py defaults to
+            database_url = db.engine.url.render_as_string(hide_password=False)
+        
+        def run_migrations():
+            if not alembic_bin:
+                app.logger.error("Background migration failed: alembic executable not found")
+                return
+            result = subprocess.run(
+                [alembic_bin, 'upgrade', 'head'],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env={**os.environ, 'DATABASE_URL': database_url},
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                app.logger.error("Background migration failed: %s", result.stderr)
+            else:
+                app.logger.info("Background migration completed")
+        
+        migration_thread = threading.Thread(target=run_migrations, daemon=True)
+        app.extensions['migration_thread'] = migration_thread
+        migration_thread.start()
+    elif migration_mode == 'create_all':
+        # Single-process setups without Alembic (e.g. a fresh local SQLite file)
+        with app.app_context():
+            db.create_all()
     
     # Initialize Pusher service for real-time notifications (Android sync will use this)
     try:
@@ -233,7 +297,7 @@ def create_app(config=None):
         )
         app.logger.info("Pusher service initialized for Android sync notifications")
     except Exception as e:
-        app.logger.error(f"Failed to initialize Pusher service: {str(e)}", exc_info=True)
+        app.logger.error("Failed to initialize Pusher service: %s", e, exc_info=True)
         pusher_service = None
     
     # Store Pusher service in app config for access in routes
@@ -1,11 +1,23 @@
 """Flask application configuration."""
 import os
 from datetime import timedelta
+from functools import lru_cache
 
 class Config:
     """Base configuration."""
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Raise on any relationship lazy load that would emit SQL (dev aid for N+1s)
+    SQLALCHEMY_STRICT_LAZY = os.getenv('SQLALCHEMY_STRICT_LAZY', 'False').lower() == 'true'
+    # Connection pool sized for several dashboard users at once, and a larger
+    # compiled-statement cache so repeated queries skip SQL compilation
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 40)),
+        'pool_pre_ping': True,
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        'query_cache_size': int(os.getenv('DB_QUERY_CACHE_SIZE', 1200)),
+    }
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'dev-jwt-secret-key')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', 86400)))
     
@@ -28,6 +40,10 @@ class Config:
     MAIL_PASSWORD = os.getenv('MAIL_PASSWORD', '')
     MAIL_DEFAULT_SENDER = os.getenv('MAIL_DEFAULT_SENDER', os.getenv('MAIL_USERNAME', ''))
     FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
+    
+    # Schema migrations at startup: 'skip' (run alembic in a release step),
+    # 'async' (alembic upgrade head in a background thread) or 'create_all'
+    MIGRATION_MODE = os.getenv('MIGRATION_MODE', 'skip')
 
 
 class DevelopmentConfig(Config):
@@ -49,7 +65,7 @@ class ProductionConfig(Config):
     
     SQLALCHEMY_DATABASE_URI = f'sqlite:///{database_path}'
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_pre_ping': True,
+        **Config.SQLALCHEMY_ENGINE_OPTIONS,
         'pool_recycle': 300,
     }
 
@@ -58,11 +74,20 @@ class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # In-memory SQLite runs on a single static connection, so no pool sizing
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=3600)
+    # Minimum bcrypt cost keeps user fixtures fast; production never sets this
+    BCRYPT_ROUNDS = 4
 
 
+@lru_cache(maxsize=1)
 def get_config():
-    """Get configuration based on environment."""
+    """Get configuration based on environment.
+
+    Resolved once per process; call ``get_config.cache_clear()`` after changing
+    FLASK_ENV (e.g. in tests).
+    """
     env = os.getenv('FLASK_ENV', 'development')
     if env == 'production':
         return ProductionConfig
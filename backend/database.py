@@ -1,4 +1,59 @@
 """Database initialization module."""
+import uuid
+
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import raiseload
 
 db = SQLAlchemy()
+
+# Never generated by uuid4(), so no row has it
+_NIL_UUID = '00000000-0000-0000-0000-000000000000'
+
+
+class _UUIDString(TypeDecorator):
+    """
+    Primary/foreign key type for tables created in migration 001: native uuid
+    on PostgreSQL, String(36) on SQLite. Values stay plain str on both.
+
+    Ids often come straight from URLs and request bodies. PostgreSQL rejects a
+    non-UUID string compared to a uuid column with DataError, so such values
+    are bound as the nil UUID instead: lookups find nothing (a 404, as with
+    String(36)) and foreign-key writes still fail the FK constraint.
+    """
+    impl = db.Uuid(as_uuid=False)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'sqlite':
+            return dialect.type_descriptor(db.String(36))
+        return dialect.type_descriptor(db.Uuid(as_uuid=False))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == 'sqlite':
+            return value
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            return _NIL_UUID
+
+
+UUIDType = _UUIDString()
+
+
+@event.listens_for(db.session, 'do_orm_execute')
+def _raise_on_lazy_sql(orm_execute_state):
+    """Add raiseload('*', sql_only=True) to ORM selects when SQLALCHEMY_STRICT_LAZY is on.
+
+    Relationships a query does not load explicitly (joinedload/selectinload)
+    then raise on first access instead of silently emitting a query per row.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and current_app.config.get('SQLALCHEMY_STRICT_LAZY')
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload('*', sql_only=True))
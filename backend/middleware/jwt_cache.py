@@ -0,0 +1,88 @@
+"""Short-lived cache of verified JWT claims for the RBAC decorators."""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, g, request
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+
+# Verified claims are reused for at most this many seconds (never past 'exp')
+CACHE_TTL_SECONDS = 5
+CACHE_MAX_ENTRIES = 10000
+
+_cache = OrderedDict()
+_lock = threading.RLock()
+
+
+def _bearer_token():
+    """Return the raw token from the Authorization header, or None."""
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme != 'Bearer' or not token:
+        return None
+    return token
+
+
+def cached_verify():
+    """
+    Verify the request's JWT and return its claims.
+
+    Behaves like ``verify_jwt_in_request()`` followed by ``get_jwt()``, but a
+    token that was fully verified within the last few seconds is not decoded
+    and signature-checked again. The request context is populated the same way
+    on a cache hit, so ``get_jwt()``/``get_jwt_identity()`` keep working in views.
+
+    Returns:
+        Dictionary of JWT claims
+
+    Raises:
+        The same flask_jwt_extended exceptions as verify_jwt_in_request()
+    """
+    token = _bearer_token()
+    if token is None:
+        # No header token: let flask_jwt_extended raise the usual error
+        verify_jwt_in_request()
+        return get_jwt()
+
+    # The secret is part of the key so apps with different keys never share entries
+    key = hashlib.sha256(
+        f"{current_app.config.get('JWT_SECRET_KEY')}:{token}".encode()
+    ).digest()
+    now = time.time()
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            if now < entry[0]:
+                _, jwt_header, jwt_data, jwt_user, jwt_location = entry
+                g._jwt_extended_jwt_user = jwt_user
+                g._jwt_extended_jwt_header = jwt_header
+                g._jwt_extended_jwt = jwt_data
+                g._jwt_extended_jwt_location = jwt_location
+                return jwt_data
+            del _cache[key]
+
+    result = verify_jwt_in_request()
+    if result is None:
+        # Exempt method (e.g. OPTIONS): nothing verified, nothing to cache
+        return get_jwt()
+
+    jwt_header, jwt_data = result
+    expires_at = min(now + CACHE_TTL_SECONDS, jwt_data.get('exp', now))
+    with _lock:
+        _cache[key] = (
+            expires_at,
+            jwt_header,
+            jwt_data,
+            g._jwt_extended_jwt_user,
+            g._jwt_extended_jwt_location,
+        )
+        if len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return jwt_data
+
+
+def clear_cache():
+    """Drop all cached claims."""
+    with _lock:
+        _cache.clear()
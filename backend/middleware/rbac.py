@@ -1,8 +1,8 @@
 """Role-Based Access Control (RBAC) middleware."""
 from functools import wraps
-from flask import jsonify, request
-from flask_jwt_extended import jwt_required, get_jwt
+from flask import jsonify
 from typing import List, Union
+from middleware.jwt_cache import cached_verify
 
 
 def require_role(*allowed_roles: str):
@@ -21,15 +21,22 @@ def require_role(*allowed_roles: str):
         def get_users():
             return {'users': []}
     """
+    # Resolve the role set once when the decorator is applied, not per request
+    allowed = frozenset(allowed_roles)
+    single = next(iter(allowed)) if len(allowed) == 1 else None
+    
     def decorator(fn):
         @wraps(fn)
-        @jwt_required()
         def wrapper(*args, **kwargs):
-            claims = get_jwt()
+            claims = cached_verify()
             user_role = claims.get('role')
             
-            # Check if user's role is in allowed roles
-            if user_role not in allowed_roles:
+            # Check if user's role is in allowed roles (plain compare for the one-role case)
+            if single is not None:
+                denied = user_role != single
+            else:
+                denied = user_role not in allowed
+            if denied:
                 return jsonify({'error': 'Insufficient permissions'}), 403
             
             return fn(*args, **kwargs)
@@ -40,7 +47,7 @@ def require_role(*allowed_roles: str):
 def require_admin(fn):
     """
     Decorator to restrict endpoint to admin users only.
-    Skips authentication for OPTIONS requests (CORS preflight).
+    CORS preflight (OPTIONS) never reaches this; Flask answers it for each route.
     
     Args:
         fn: Function to decorate
@@ -50,19 +57,12 @@ def require_admin(fn):
     """
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        # Allow OPTIONS requests without authentication (CORS preflight)
-        if request.method == 'OPTIONS':
-            return '', 200
-        
-        # For other methods, require JWT authentication
-        from flask_jwt_extended import verify_jwt_in_request
+        # Require JWT authentication
         try:
-            verify_jwt_in_request()
+            claims = cached_verify()
         except Exception as e:
             return jsonify({'error': 'Authentication required'}), 401
         
-        # Get claims after verification
-        claims = get_jwt()
         user_role = claims.get('role')
         
         # Check if user's role is admin
@@ -116,14 +116,15 @@ def require_any_role(*allowed_roles: str):
         def get_profile():
             return {'profile': {}}
     """
+    allowed = frozenset(allowed_roles)
+    
     def decorator(fn):
         @wraps(fn)
-        @jwt_required()
         def wrapper(*args, **kwargs):
-            claims = get_jwt()
+            claims = cached_verify()
             user_role = claims.get('role')
             
-            if user_role not in allowed_roles:
+            if user_role not in allowed:
                 return jsonify({'error': 'Insufficient permissions'}), 403
             
             return fn(*args, **kwargs)
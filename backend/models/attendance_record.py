@@ -2,6 +2,7 @@
 from database import db
 from datetime import datetime
 import uuid
+from utils.formatters import format_utc_iso
 
 
 class AttendanceRecord(db.Model):
@@ -31,10 +32,10 @@ class AttendanceRecord(db.Model):
             'person_type': self.person_type,
             'person_id': self.person_id,
             'person_name': self.person_name,
-            'check_in_time': self.check_in_time.isoformat() + 'Z',
-            'check_out_time': self.check_out_time.isoformat() + 'Z' if self.check_out_time else None,
+            'check_in_time': format_utc_iso(self.check_in_time),
+            'check_out_time': format_utc_iso(self.check_out_time),
             'stay_duration': self.stay_duration,
             'device_serial': self.device_serial,
-            'created_at': self.created_at.isoformat() + 'Z',
-            'updated_at': self.updated_at.isoformat() + 'Z'
+            'created_at': format_utc_iso(self.created_at),
+            'updated_at': format_utc_iso(self.updated_at)
         }
@@ -2,6 +2,7 @@
 from database import db
 from datetime import datetime
 import uuid
+from utils.formatters import format_utc_iso
 
 
 class DailyAttendanceSummary(db.Model):
@@ -38,10 +39,10 @@ class DailyAttendanceSummary(db.Model):
             'person_name': self.person_name,
             'person_type': self.person_type,
             'status': self.status,
-            'first_check_in': self.first_check_in.isoformat() + 'Z' if self.first_check_in else None,
-            'last_check_out': self.last_check_out.isoformat() + 'Z' if self.last_check_out else None,
+            'first_check_in': format_utc_iso(self.first_check_in),
+            'last_check_out': format_utc_iso(self.last_check_out),
             'total_time_minutes': self.total_time_minutes,
             'visit_count': self.visit_count,
-            'created_at': self.created_at.isoformat() + 'Z',
-            'updated_at': self.updated_at.isoformat() + 'Z'
+            'created_at': format_utc_iso(self.created_at),
+            'updated_at': format_utc_iso(self.updated_at)
         }
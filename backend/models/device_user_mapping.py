@@ -2,6 +2,7 @@
 from database import db
 from datetime import datetime
 import uuid
+from utils.formatters import format_utc_iso
 
 
 class DeviceUserMapping(db.Model):
@@ -29,6 +30,6 @@ class DeviceUserMapping(db.Model):
             'device_user_id': self.device_user_id,
             'person_type': self.person_type,
             'person_id': self.person_id,
-            'created_at': self.created_at.isoformat() + 'Z',
-            'updated_at': self.updated_at.isoformat() + 'Z'
+            'created_at': format_utc_iso(self.created_at),
+            'updated_at': format_utc_iso(self.updated_at)
         }
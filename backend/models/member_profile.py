@@ -1,15 +1,25 @@
 """Member profile model."""
-from database import db
+from database import db, UUIDType
 from datetime import datetime
+from operator import attrgetter
 import uuid
+from utils.formatters import format_utc_iso
+
+
+# Columns serialized as-is by to_dict(); read in one C-level attrgetter call
+_PLAIN_FIELDS = (
+    'id', 'user_id', 'member_number', 'full_name', 'phone', 'cnic', 'gender',
+    'admission_fee_paid', 'current_package_id', 'trainer_id', 'is_frozen', 'profile_picture',
+)
+_get_plain_fields = attrgetter(*_PLAIN_FIELDS)
 
 
 class MemberProfile(db.Model):
     """Member profile model."""
     __tablename__ = 'member_profiles'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, unique=True)
+    id = db.Column(UUIDType, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = db.Column(UUIDType, db.ForeignKey('users.id'), nullable=False, unique=True)
     member_number = db.Column(db.Integer, unique=True, nullable=True)
     full_name = db.Column(db.String(100), nullable=False, default='')
     phone = db.Column(db.String(20), unique=False, nullable=True, index=True)
@@ -18,8 +28,8 @@ class MemberProfile(db.Model):
     date_of_birth = db.Column(db.Date)
     admission_date = db.Column(db.Date)
     admission_fee_paid = db.Column(db.Boolean, default=False, nullable=False)
-    current_package_id = db.Column(db.String(36), db.ForeignKey('packages.id'))
-    trainer_id = db.Column(db.String(36), db.ForeignKey('trainer_profiles.id'))
+    current_package_id = db.Column(UUIDType, db.ForeignKey('packages.id'))
+    trainer_id = db.Column(UUIDType, db.ForeignKey('trainer_profiles.id'))
     package_start_date = db.Column(db.DateTime)
     package_expiry_date = db.Column(db.DateTime)
     is_frozen = db.Column(db.Boolean, default=False, nullable=False)
@@ -27,32 +37,39 @@ class MemberProfile(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # Admin list ordering, trainer roster filters and renewal scans (see migration 021)
+        db.Index('ix_member_profiles_created_at', 'created_at'),
+        # Also serves trainer_id FK lookups; there is no single-column index
+        db.Index('ix_member_profiles_trainer_frozen', 'trainer_id', 'is_frozen'),
+        db.Index(
+            'ix_member_profiles_expiry', 'package_expiry_date',
+            postgresql_where=db.text('package_expiry_date IS NOT NULL'),
+            sqlite_where=db.text('package_expiry_date IS NOT NULL'),
+        ),
+        # Revenue projection: unfrozen members joined to their package (see migration 022)
+        db.Index('ix_member_profiles_frozen_package', 'is_frozen', 'current_package_id'),
+        # Members-by-package lookups (see migration 024)
+        db.Index('ix_member_profiles_current_package', 'current_package_id'),
+    )
+    
     # Relationships - Admin management only (keep transactions for finance)
     transactions = db.relationship('Transaction', backref='member', cascade='all, delete-orphan')
-    trainer = db.relationship('TrainerProfile', foreign_keys=[trainer_id], backref='assigned_members')
+    # selectin: list endpoints load every member's trainer in one IN (...) query
+    trainer = db.relationship('TrainerProfile', foreign_keys=[trainer_id], backref='assigned_members', lazy='selectin')
     
     def __repr__(self):
         return f'<MemberProfile {self.user_id}>'
     
     def to_dict(self):
         """Convert member profile to dictionary."""
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'member_number': self.member_number,
-            'full_name': self.full_name,
-            'phone': self.phone,
-            'cnic': self.cnic,
-            'gender': self.gender,
-            'date_of_birth': self.date_of_birth.isoformat() if self.date_of_birth else None,
-            'admission_date': self.admission_date.isoformat() if self.admission_date else None,
-            'admission_fee_paid': self.admission_fee_paid,
-            'current_package_id': self.current_package_id,
-            'trainer_id': self.trainer_id,
-            'package_start_date': self.package_start_date.isoformat() + 'Z' if self.package_start_date else None,
-            'package_expiry_date': self.package_expiry_date.isoformat() + 'Z' if self.package_expiry_date else None,
-            'is_frozen': self.is_frozen,
-            'profile_picture': self.profile_picture,
-            'created_at': self.created_at.isoformat() + 'Z',
-            'updated_at': self.updated_at.isoformat() + 'Z',
-        }
+        data = dict(zip(_PLAIN_FIELDS, _get_plain_fields(self)))
+        date_of_birth = self.date_of_birth
+        admission_date = self.admission_date
+        data['date_of_birth'] = date_of_birth.isoformat() if date_of_birth else None
+        data['admission_date'] = admission_date.isoformat() if admission_date else None
+        data['package_start_date'] = format_utc_iso(self.package_start_date)
+        data['package_expiry_date'] = format_utc_iso(self.package_expiry_date)
+        data['created_at'] = format_utc_iso(self.created_at)
+        data['updated_at'] = format_utc_iso(self.updated_at)
+        return data
@@ -1,5 +1,5 @@
 """Package model."""
-from database import db
+from database import db, UUIDType
 from datetime import datetime
 import uuid
 
@@ -8,17 +8,18 @@ class Package(db.Model):
     """Package model for membership plans."""
     __tablename__ = 'packages'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDType, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = db.Column(db.String(100), nullable=False)
     duration_days = db.Column(db.Integer, nullable=False)
-    price = db.Column(db.Numeric(10, 2), nullable=False)
+    price = db.Column(db.Numeric(10, 2, asdecimal=False), nullable=False)
     description = db.Column(db.Text)
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    member_profiles = db.relationship('MemberProfile', backref='package')
+    # MemberProfile.package is selectin-loaded so member lists don't issue one query per row
+    member_profiles = db.relationship('MemberProfile', backref=db.backref('package', lazy='selectin'))
     
     def __repr__(self):
         return f'<Package {self.name}>'
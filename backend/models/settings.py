@@ -8,7 +8,7 @@ class Settings(db.Model):
     __tablename__ = 'settings'
     
     id = db.Column(db.Integer, primary_key=True)
-    admission_fee = db.Column(db.Numeric(10, 2), default=0, nullable=False)
+    admission_fee = db.Column(db.Numeric(10, 2, asdecimal=False), default=0, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
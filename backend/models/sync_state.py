@@ -2,6 +2,7 @@
 from database import db
 from datetime import datetime
 import uuid
+from utils.formatters import format_utc_iso
 
 
 class SyncState(db.Model):
@@ -23,8 +24,8 @@ class SyncState(db.Model):
         return {
             'id': self.id,
             'device_user_id': self.device_user_id,
-            'last_processed_timestamp': self.last_processed_timestamp.isoformat() + 'Z',
+            'last_processed_timestamp': format_utc_iso(self.last_processed_timestamp),
             'device_serial': self.device_serial,
-            'created_at': self.created_at.isoformat() + 'Z',
-            'updated_at': self.updated_at.isoformat() + 'Z'
+            'created_at': format_utc_iso(self.created_at),
+            'updated_at': format_utc_iso(self.updated_at)
         }
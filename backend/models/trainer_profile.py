@@ -1,5 +1,5 @@
 """Trainer profile model."""
-from database import db
+from database import db, UUIDType
 from datetime import datetime
 import uuid
 
@@ -8,16 +8,16 @@ class TrainerProfile(db.Model):
     """Trainer profile model."""
     __tablename__ = 'trainer_profiles'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, unique=True)
+    id = db.Column(UUIDType, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = db.Column(UUIDType, db.ForeignKey('users.id'), nullable=False, unique=True)
     full_name = db.Column(db.String(100), nullable=True)
     gender = db.Column(db.String(10), nullable=True)
     date_of_birth = db.Column(db.Date, nullable=True)
-    phone = db.Column(db.String(20), nullable=True)
-    cnic = db.Column(db.String(20), nullable=True)
-    email = db.Column(db.String(100), nullable=True)
+    phone = db.Column(db.String(20), nullable=True, index=True)
+    cnic = db.Column(db.String(20), nullable=True, index=True)
+    email = db.Column(db.String(100), nullable=True, index=True)
     specialization = db.Column(db.String(100), nullable=False)
-    salary_rate = db.Column(db.Numeric(10, 2), nullable=False)
+    salary_rate = db.Column(db.Numeric(10, 2, asdecimal=False), nullable=False)
     hire_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     availability = db.Column(db.Text, nullable=True)  # JSON string storing weekly schedule
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
@@ -1,8 +1,9 @@
 """Transaction model."""
-from database import db
+from database import db, UUIDType
 from datetime import datetime
 import uuid
 from enum import Enum
+from utils.formatters import format_utc_iso
 
 
 class TransactionType(Enum):
@@ -23,16 +24,16 @@ class Transaction(db.Model):
     """Transaction model."""
     __tablename__ = 'transactions'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    member_id = db.Column(db.String(36), db.ForeignKey('member_profiles.id'), nullable=False, index=True)
-    amount = db.Column(db.Numeric(10, 2), nullable=False)
+    id = db.Column(UUIDType, primary_key=True, default=lambda: str(uuid.uuid4()))
+    member_id = db.Column(UUIDType, db.ForeignKey('member_profiles.id'), nullable=False)
+    amount = db.Column(db.Numeric(10, 2, asdecimal=False), nullable=False)
     transaction_type = db.Column(db.Enum(TransactionType), nullable=False)
     status = db.Column(db.Enum(TransactionStatus), nullable=False, default=TransactionStatus.PENDING)
     due_date = db.Column(db.DateTime)
     paid_date = db.Column(db.DateTime)
-    trainer_fee = db.Column(db.Numeric(10, 2), default=0)
-    package_price = db.Column(db.Numeric(10, 2), default=0)
-    discount_amount = db.Column(db.Numeric(10, 2), default=0)
+    trainer_fee = db.Column(db.Numeric(10, 2, asdecimal=False), default=0)
+    package_price = db.Column(db.Numeric(10, 2, asdecimal=False), default=0)
+    discount_amount = db.Column(db.Numeric(10, 2, asdecimal=False), default=0)
     discount_type = db.Column(db.String(20), default='fixed')  # 'fixed' or 'percentage'
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     
@@ -44,6 +45,29 @@ class Transaction(db.Model):
     # Payment description (optional notes)
     description = db.Column(db.Text)
     
+    __table_args__ = (
+        # Partial index for the overdue scan (see migration 020)
+        db.Index(
+            'ix_transactions_pending_due', 'due_date',
+            postgresql_where=db.text("status = 'PENDING'"),
+            sqlite_where=db.text("status = 'PENDING'"),
+        ),
+        # Completed-revenue windows by paid_date (see migration 022)
+        db.Index('ix_transactions_status_paid_date', 'status', 'paid_date'),
+        # Per-status totals for the finance report (see migration 023)
+        db.Index('ix_transactions_status_amount', 'status', 'amount'),
+        # Transaction and overdue lists in their sort order (see migration 024)
+        db.Index('ix_transactions_created_at', 'created_at'),
+        db.Index('ix_transactions_status_created_at', 'status', 'created_at'),
+        # Also the only member_id index: serves the FK and per-member lookups
+        db.Index('ix_transactions_member_created_at', 'member_id', 'created_at'),
+        db.Index(
+            'ix_transactions_overdue_due', 'due_date',
+            postgresql_where=db.text("status = 'OVERDUE'"),
+            sqlite_where=db.text("status = 'OVERDUE'"),
+        ),
+    )
+    
     def __repr__(self):
         return f'<Transaction {self.transaction_type} {self.amount}>'
     
@@ -55,15 +79,15 @@ class Transaction(db.Model):
             'amount': float(self.amount),
             'transaction_type': self.transaction_type.value,
             'status': self.status.value,
-            'due_date': self.due_date.isoformat() + 'Z' if self.due_date else None,
-            'paid_date': self.paid_date.isoformat() + 'Z' if self.paid_date else None,
+            'due_date': format_utc_iso(self.due_date),
+            'paid_date': format_utc_iso(self.paid_date),
             'trainer_fee': float(self.trainer_fee) if self.trainer_fee else 0,
             'package_price': float(self.package_price) if self.package_price else 0,
             'discount_amount': float(self.discount_amount) if self.discount_amount else 0,
             'discount_type': self.discount_type or 'fixed',
-            'created_at': self.created_at.isoformat() + 'Z',
+            'created_at': format_utc_iso(self.created_at),
             'is_reversed': self.is_reversed,
-            'reversed_at': self.reversed_at.isoformat() + 'Z' if self.reversed_at else None,
+            'reversed_at': format_utc_iso(self.reversed_at),
             'reversed_by': self.reversed_by,
             'description': self.description,
         }
@@ -1,8 +1,9 @@
 """User model."""
-from database import db
+from database import db, UUIDType
 from datetime import datetime
 import uuid
 from enum import Enum
+from utils.formatters import format_utc_iso
 
 
 class UserRole(Enum):
@@ -16,7 +17,7 @@ class User(db.Model):
     """User model for authentication."""
     __tablename__ = 'users'
     
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(UUIDType, primary_key=True, default=lambda: str(uuid.uuid4()))
     username = db.Column(db.String(50), unique=True, nullable=False, index=True)
     password_hash = db.Column(db.String(255), nullable=False)
     role = db.Column(db.Enum(UserRole), nullable=False, default=UserRole.MEMBER)
@@ -26,6 +27,11 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # Member growth counts by role and signup date (see migration 022)
+        db.Index('ix_users_role_created_at', 'role', 'created_at'),
+    )
+    
     # Relationships - Admin management only
     member_profile = db.relationship('MemberProfile', backref='user', uselist=False, cascade='all, delete-orphan')
     trainer_profile = db.relationship('TrainerProfile', backref='user', uselist=False, cascade='all, delete-orphan')
@@ -40,6 +46,6 @@ class User(db.Model):
             'username': self.username,
             'role': self.role.value,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() + 'Z',
-            'updated_at': self.updated_at.isoformat() + 'Z',
+            'created_at': format_utc_iso(self.created_at),
+            'updated_at': format_utc_iso(self.updated_at),
         }
@@ -1,6 +1,5 @@
 """Complete admin routes for member and trainer management."""
-from flask import Blueprint, request, jsonify, send_file
-from flask_jwt_extended import jwt_required
+from flask import Blueprint, Response, request, jsonify, send_file, stream_with_context
 from models.user import User, UserRole
 from models.member_profile import MemberProfile
 from models.trainer_profile import TrainerProfile
@@ -8,14 +7,68 @@ from models.package import Package
 from models.transaction import Transaction, TransactionStatus, TransactionType
 from services.password_service import PasswordService
 from middleware.rbac import require_admin
+from utils.response_cache import cached_count, cached_json, invalidate as invalidate_cached_responses
+from utils.json_provider import utc_json_dumps
+from utils.formatters import parse_utc_iso
 from database import db
 from datetime import datetime, timedelta
-from sqlalchemy import func
+from sqlalchemy import func, and_, or_, case, select
+from sqlalchemy.orm import joinedload, lazyload, selectinload
+import secrets
 import uuid
+from itertools import chain
 from io import BytesIO
 
 admin_complete_bp = Blueprint('admin_complete', __name__)
 
+# Required (non-empty) body fields, checked in this order
+MEMBER_REQUIRED_FIELDS = ('full_name', 'phone')
+TRAINER_REQUIRED_FIELDS = ('specialization', 'phone', 'email')
+
+# Rows fetched and written per chunk by the streamed payments list
+PAYMENTS_STREAM_BATCH = 500
+
+# Upper bound on ids accepted by the batch mark-paid endpoint
+MARK_PAID_BATCH_LIMIT = 500
+
+# Trainer columns list_trainers can return, in TrainerProfile.to_dict() order
+TRAINER_LIST_COLUMNS = (
+    TrainerProfile.id,
+    TrainerProfile.user_id,
+    TrainerProfile.full_name,
+    TrainerProfile.gender,
+    TrainerProfile.date_of_birth,
+    TrainerProfile.phone,
+    TrainerProfile.cnic,
+    TrainerProfile.email,
+    TrainerProfile.specialization,
+    TrainerProfile.salary_rate,
+    TrainerProfile.hire_date,
+    TrainerProfile.availability,
+    TrainerProfile.created_at,
+    TrainerProfile.updated_at,
+)
+
+
+def _first_missing_field(data, required_fields):
+    """Return the first required field that is absent or empty, or None."""
+    return next((field for field in required_fields if not data.get(field)), None)
+
+
+def _parse_request_date(data, field):
+    """
+    Return ``data[field]`` (YYYY-MM-DD, zero padding optional) as a date, or
+    None when it is absent or empty. Raises ValueError naming the field otherwise.
+    """
+    value = data.get(field)
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid {field}: expected YYYY-MM-DD')
+
+
 # ============================================================================
 # MEMBER ROUTES
 # ============================================================================
@@ -23,22 +76,60 @@ admin_complete_bp = Blueprint('admin_complete', __name__)
 @admin_complete_bp.route('/members', methods=['GET'])
 @require_admin
 def list_members():
-    """List all members with pagination."""
+    """
+    List members, newest first.
+    
+    Pages are addressed with ``page`` (OFFSET) or, for deep pages, with the
+    ``cursor`` returned as ``next_cursor`` by the previous response (keyset).
+    """
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
+    cursor = request.args.get('cursor')
+    
+    if per_page < 1:
+        return jsonify({'error': 'Invalid pagination parameters'}), 400
     
-    paginated = MemberProfile.query.paginate(page=page, per_page=per_page, error_out=False)
+    # Users are joined into the page query and trainers come from one selectin
+    # query, instead of two lookups per member. Only the columns the list shows
+    # are loaded from those tables (no password hashes, availability, etc.)
+    query = MemberProfile.query.options(
+        joinedload(MemberProfile.user).load_only(User.username),
+        selectinload(MemberProfile.trainer).load_only(TrainerProfile.full_name, TrainerProfile.specialization),
+        # The list doesn't show package details; skip the selectin package load
+        lazyload(MemberProfile.package)
+    ).order_by(MemberProfile.created_at.desc(), MemberProfile.id.desc())
+    
+    if cursor:
+        # Keyset pagination: seek past the previous page's last row on the
+        # created_at index instead of scanning and discarding OFFSET rows
+        try:
+            cursor_created_at, cursor_id = cursor.split('|', 1)
+            cursor_created_at = datetime.fromisoformat(cursor_created_at)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        
+        query = query.filter(or_(
+            MemberProfile.created_at < cursor_created_at,
+            and_(MemberProfile.created_at == cursor_created_at, MemberProfile.id < cursor_id)
+        ))
+    else:
+        query = query.offset((max(page, 1) - 1) * per_page)
+    
+    # One extra row tells us whether another page exists without a COUNT(*)
+    items = query.limit(per_page + 1).all()
+    has_next = len(items) > per_page
+    items = items[:per_page]
     
     members = []
-    for member in paginated.items:
+    for member in items:
         member_dict = member.to_dict()
-        user = User.query.get(member.user_id)
+        user = member.user
         if user:
             member_dict['username'] = user.username
         
         # Add trainer information if assigned
         if member.trainer_id:
-            trainer = TrainerProfile.query.get(member.trainer_id)
+            trainer = member.trainer
             if trainer:
                 member_dict['trainer_name'] = trainer.full_name
                 member_dict['trainer_specialization'] = trainer.specialization
@@ -49,11 +140,19 @@ def list_members():
         
         members.append(member_dict)
     
+    next_cursor = None
+    if has_next and items:
+        last = items[-1]
+        next_cursor = f"{last.created_at.isoformat()}|{last.id}"
+    
     return jsonify({
         'members': members,
-        'total': paginated.total,
+        # The first page recounts; later pages and cursor pages reuse that total
+        'total': cached_count('count:members', MemberProfile.query, refresh=not cursor and page <= 1),
+        'has_next': has_next,
         'page': page,
-        'per_page': per_page
+        'per_page': per_page,
+        'next_cursor': next_cursor
     }), 200
 
 
@@ -113,10 +212,10 @@ def export_members_excel():
         # Add data rows starting from row 3
         for row_num, member in enumerate(all_members, 3):
             # Get related data
-            package = Package.query.get(member.current_package_id) if member.current_package_id else None
+            package = db.session.get(Package, member.current_package_id) if member.current_package_id else None
             package_name = package.name if package else 'Not Assigned'
             
-            trainer = TrainerProfile.query.get(member.trainer_id) if member.trainer_id else None
+            trainer = db.session.get(TrainerProfile, member.trainer_id) if member.trainer_id else None
             trainer_name = trainer.full_name if trainer else 'Not Assigned'
             
             # Format dates
@@ -228,7 +327,7 @@ def export_finance_excel():
         month_text = ""
         if selected_month:
             try:
-                month_date = datetime.strptime(selected_month + '-01', '%Y-%m-%d')
+                month_date = datetime.fromisoformat(selected_month + '-01')
                 month_text = f" - {month_date.strftime('%B %Y')}"
             except:
                 pass
@@ -359,18 +458,18 @@ def export_finance_excel():
 @require_admin
 def get_member(member_id):
     """Get a specific member by ID."""
-    member = MemberProfile.query.get(member_id)
+    member = db.session.get(MemberProfile, member_id)
     if not member:
         return jsonify({'error': 'Member not found'}), 404
     
     member_dict = member.to_dict()
-    user = User.query.get(member.user_id)
+    user = db.session.get(User, member.user_id)
     if user:
         member_dict['username'] = user.username
     
     # Add trainer information if assigned
     if member.trainer_id:
-        trainer = TrainerProfile.query.get(member.trainer_id)
+        trainer = db.session.get(TrainerProfile, member.trainer_id)
         if trainer:
             member_dict['trainer_name'] = trainer.full_name
             member_dict['trainer_specialization'] = trainer.specialization
@@ -389,52 +488,39 @@ def create_member():
     data = request.get_json()
     
     # Validate required fields (only full_name and phone are required)
-    required_fields = ['full_name', 'phone']
-    for field in required_fields:
-        if not data.get(field):
-            return jsonify({'error': f'Missing required field: {field}'}), 400
+    missing = _first_missing_field(data, MEMBER_REQUIRED_FIELDS)
+    if missing:
+        return jsonify({'error': f'Missing required field: {missing}'}), 400
+    
+    try:
+        dob = _parse_request_date(data, 'date_of_birth')
+        admission_date = _parse_request_date(data, 'admission_date') or datetime.utcnow()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     try:
         # Create user with auto-generated username
         # Use phone to generate username
-        auto_username = 'member_' + data['phone'][-4:] + '_' + str(uuid.uuid4())[:8]
-        auto_password = str(uuid.uuid4())
+        auto_username = 'member_' + data['phone'][-4:] + '_' + secrets.token_urlsafe(6)
+        auto_password = secrets.token_urlsafe(24)
         
+        # Ids are assigned client-side so the member and transaction can reference
+        # them before anything is flushed; all three rows go out in one flush
         user = User(
+            id=str(uuid.uuid4()),
             username=auto_username,
-            password_hash=PasswordService.hash_password(auto_password),
+            password_hash=PasswordService.hash_generated_password(auto_password),
             role=UserRole.MEMBER,
             is_active=True
         )
-        db.session.add(user)
-        db.session.flush()
-        
-        # Parse date_of_birth if provided
-        dob = None
-        if data.get('date_of_birth'):
-            try:
-                from datetime import datetime as dt
-                dob = dt.strptime(data['date_of_birth'], '%Y-%m-%d').date()
-            except:
-                dob = None
-        
-        # Parse admission_date if provided
-        admission_date = datetime.utcnow()
-        if data.get('admission_date'):
-            try:
-                from datetime import datetime as dt
-                admission_date = dt.strptime(data['admission_date'], '%Y-%m-%d')
-            except:
-                admission_date = datetime.utcnow()
         
         # Calculate package dates if package is assigned
         package_start_date = None
         package_expiry_date = None
-        if data.get('package_id'):
-            package = Package.query.get(data['package_id'])
-            if package:
-                package_start_date = datetime.utcnow()
-                package_expiry_date = package_start_date + timedelta(days=package.duration_days)
+        package = db.session.get(Package, data['package_id']) if data.get('package_id') else None
+        if package:
+            package_start_date = datetime.utcnow()
+            package_expiry_date = package_start_date + timedelta(days=package.duration_days)
         
         # Auto-generate member_number starting from 10
         # Get the highest member_number and increment by 1
@@ -449,6 +535,7 @@ def create_member():
         cnic_value = data.get('cnic') if data.get('cnic') else None
         
         member = MemberProfile(
+            id=str(uuid.uuid4()),
             user_id=user.id,
             member_number=new_member_number,
             full_name=data['full_name'],
@@ -464,8 +551,6 @@ def create_member():
             is_frozen=False,
             profile_picture=data.get('profile_picture')
         )
-        db.session.add(member)
-        db.session.flush()
         
         # Create admission fee transaction (PENDING status)
         # Due date should be the package expiry date if package is assigned, otherwise 7 days from now
@@ -475,11 +560,7 @@ def create_member():
         trainer_charge = float(data.get('trainer_charge', 0))
         
         # Get package price if package is assigned
-        package_price = 0
-        if data.get('package_id'):
-            package = Package.query.get(data['package_id'])
-            if package:
-                package_price = float(package.price)
+        package_price = float(package.price) if package else 0
         
         # Calculate total amount for transaction
         # Total = admission_fee + package_price + trainer_charge
@@ -511,7 +592,7 @@ def create_member():
             discount_type=discount_type,
             created_at=datetime.utcnow()
         )
-        db.session.add(admission_transaction)
+        db.session.add_all([user, member, admission_transaction])
         db.session.commit()
         
         member_dict = member.to_dict()
@@ -527,12 +608,21 @@ def create_member():
 @require_admin
 def update_member(member_id):
     """Update a member."""
-    member = MemberProfile.query.get(member_id)
+    member = db.session.get(MemberProfile, member_id)
     if not member:
         return jsonify({'error': 'Member not found'}), 404
     
     data = request.get_json()
     
+    # Dates are checked before any field changes
+    try:
+        dates = {
+            field: _parse_request_date(data, field)
+            for field in ('date_of_birth', 'admission_date') if field in data
+        }
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Update member profile fields
         if 'full_name' in data:
@@ -553,27 +643,16 @@ def update_member(member_id):
         # Handle package assignment (accept both package_id and current_package_id)
         package_changed = False
         old_package_id = member.current_package_id
+        package = None
         
-        if 'package_id' in data:
-            new_package_id = data['package_id'] if data['package_id'] else None
+        package_key = 'package_id' if 'package_id' in data else 'current_package_id' if 'current_package_id' in data else None
+        if package_key:
+            new_package_id = data[package_key] if data[package_key] else None
             # If package changed, recalculate dates
             if new_package_id != member.current_package_id and new_package_id:
                 package_changed = True
-                package = Package.query.get(new_package_id)
-                if package:
-                    # Only auto-set dates if not provided
-                    if 'package_start_date' not in data or not data['package_start_date']:
-                        member.package_start_date = datetime.utcnow()
-                    if 'package_expiry_date' not in data or not data['package_expiry_date']:
-                        start_date = member.package_start_date or datetime.utcnow()
-                        member.package_expiry_date = start_date + timedelta(days=package.duration_days)
-            member.current_package_id = new_package_id
-        elif 'current_package_id' in data:
-            new_package_id = data['current_package_id'] if data['current_package_id'] else None
-            # If package changed, recalculate dates
-            if new_package_id != member.current_package_id and new_package_id:
-                package_changed = True
-                package = Package.query.get(new_package_id)
+                # Loaded once here; the pending-transaction repricing below reuses it
+                package = db.session.get(Package, new_package_id)
                 if package:
                     # Only auto-set dates if not provided
                     if 'package_start_date' not in data or not data['package_start_date']:
@@ -583,20 +662,16 @@ def update_member(member_id):
                         member.package_expiry_date = start_date + timedelta(days=package.duration_days)
             member.current_package_id = new_package_id
         
-        # Handle package dates
+        # Handle package dates (empty clears the date, malformed input is ignored)
         if 'package_start_date' in data:
-            try:
-                from datetime import datetime as dt
-                member.package_start_date = dt.fromisoformat(data['package_start_date'].replace('Z', '+00:00')) if data['package_start_date'] else None
-            except:
-                pass
+            parsed = parse_utc_iso(data['package_start_date'])
+            if parsed is not None or not data['package_start_date']:
+                member.package_start_date = parsed
         
         if 'package_expiry_date' in data:
-            try:
-                from datetime import datetime as dt
-                member.package_expiry_date = dt.fromisoformat(data['package_expiry_date'].replace('Z', '+00:00')) if data['package_expiry_date'] else None
-            except:
-                pass
+            parsed = parse_utc_iso(data['package_expiry_date'])
+            if parsed is not None or not data['package_expiry_date']:
+                member.package_expiry_date = parsed
         
         # Handle trainer assignment
         trainer_changed = False
@@ -610,8 +685,11 @@ def update_member(member_id):
         # If package or trainer changed, update all PENDING transactions for this member
         if package_changed or trainer_changed:
             # Get the new package and trainer details
-            new_package = Package.query.get(member.current_package_id) if member.current_package_id else None
-            new_trainer = TrainerProfile.query.get(member.trainer_id) if member.trainer_id else None
+            if package_changed:
+                new_package = package
+            else:
+                new_package = db.session.get(Package, member.current_package_id) if member.current_package_id else None
+            new_trainer = db.session.get(TrainerProfile, member.trainer_id) if member.trainer_id else None
             
             # Calculate new amounts (works even if package is None)
             new_package_price = float(new_package.price) if new_package and new_package.price else 0
@@ -660,25 +738,17 @@ def update_member(member_id):
         
         if 'gender' in data:
             member.gender = data['gender']
-        if 'date_of_birth' in data:
-            try:
-                from datetime import datetime as dt
-                member.date_of_birth = dt.strptime(data['date_of_birth'], '%Y-%m-%d').date() if data['date_of_birth'] else None
-            except:
-                pass
+        if 'date_of_birth' in dates:
+            member.date_of_birth = dates['date_of_birth']
         
         # Handle admission_date
-        if 'admission_date' in data:
-            try:
-                from datetime import datetime as dt
-                member.admission_date = dt.strptime(data['admission_date'], '%Y-%m-%d').date() if data['admission_date'] else None
-            except:
-                pass
+        if 'admission_date' in dates:
+            member.admission_date = dates['admission_date']
         
         db.session.commit()
         
         member_dict = member.to_dict()
-        user = User.query.get(member.user_id)
+        user = db.session.get(User, member.user_id)
         if user:
             member_dict['username'] = user.username
         
@@ -693,15 +763,18 @@ def update_member(member_id):
 @require_admin
 def delete_member(member_id):
     """Delete a member."""
-    member = MemberProfile.query.get(member_id)
-    if not member:
+    user_id = db.session.scalar(
+        db.select(MemberProfile.user_id).where(MemberProfile.id == member_id)
+    )
+    if user_id is None:
         return jsonify({'error': 'Member not found'}), 404
     
     try:
-        user = User.query.get(member.user_id)
-        db.session.delete(member)
-        if user:
-            db.session.delete(user)
+        # Set-based deletes, children first: no ORM load of the profile, user or
+        # transaction rows just to cascade them one by one
+        db.session.execute(db.delete(Transaction).where(Transaction.member_id == member_id))
+        db.session.execute(db.delete(MemberProfile).where(MemberProfile.id == member_id))
+        db.session.execute(db.delete(User).where(User.id == user_id))
         db.session.commit()
         
         return jsonify({'message': 'Member deleted successfully'}), 200
@@ -718,45 +791,96 @@ def delete_member(member_id):
 @admin_complete_bp.route('/trainers', methods=['GET'])
 @require_admin
 def list_trainers():
-    """List all trainers with pagination."""
+    """
+    List trainers ordered by id.
+    
+    Pages are addressed with ``page`` (OFFSET) or with the ``cursor`` returned
+    as ``next_cursor`` by the previous response (keyset on id). Pass
+    ``count=false`` to skip the COUNT behind ``total``; ``has_next`` is always set.
+    """
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
+    cursor = request.args.get('cursor')
+    include_total = request.args.get('count', 'true').lower() != 'false'
+    fields = request.args.get('fields')
     
-    paginated = TrainerProfile.query.paginate(page=page, per_page=per_page, error_out=False)
+    if per_page < 1:
+        return jsonify({'error': 'Invalid pagination parameters'}), 400
     
-    trainers = []
-    for trainer in paginated.items:
-        trainer_dict = trainer.to_dict()
-        user = User.query.get(trainer.user_id)
-        if user:
-            trainer_dict['username'] = user.username
-        
-        # Count assigned members
-        assigned_members_count = MemberProfile.query.filter_by(trainer_id=trainer.id).count()
-        trainer_dict['assigned_members_count'] = assigned_members_count
-        
-        trainers.append(trainer_dict)
+    # Assigned member counts pre-aggregated once instead of a COUNT per trainer
+    member_counts = db.session.query(
+        MemberProfile.trainer_id,
+        func.count(MemberProfile.id).label('member_count')
+    ).filter(
+        MemberProfile.trainer_id.isnot(None)
+    ).group_by(MemberProfile.trainer_id).subquery()
     
-    return jsonify({
+    # Plain column rows projected straight into dicts; ``fields`` (comma
+    # separated) narrows the SELECT to what the caller needs
+    wanted = set(fields.split(',')) | {'id'} if fields else None
+    columns = [
+        column for column in TRAINER_LIST_COLUMNS
+        if wanted is None or column.key in wanted
+    ]
+    
+    query = select(*columns).select_from(TrainerProfile)
+    if wanted is None or 'username' in wanted:
+        query = query.add_columns(User.username).outerjoin(User, TrainerProfile.user_id == User.id)
+    if wanted is None or 'assigned_members_count' in wanted:
+        query = query.add_columns(
+            func.coalesce(member_counts.c.member_count, 0).label('assigned_members_count')
+        ).outerjoin(member_counts, member_counts.c.trainer_id == TrainerProfile.id)
+    query = query.order_by(TrainerProfile.id)
+    
+    if cursor:
+        # Keyset pagination: seek past the previous page's last id on the
+        # primary key instead of scanning and discarding OFFSET rows
+        query = query.where(TrainerProfile.id > cursor)
+    else:
+        query = query.offset((max(page, 1) - 1) * per_page)
+    
+    # One extra row tells us whether another page exists
+    rows = db.session.execute(query.limit(per_page + 1)).mappings().all()
+    has_next = len(rows) > per_page
+    trainers = [_project_trainer(row) for row in rows[:per_page]]
+    
+    result = {
         'trainers': trainers,
-        'total': paginated.total,
+        'has_next': has_next,
         'page': page,
-        'per_page': per_page
-    }), 200
+        'per_page': per_page,
+        'next_cursor': trainers[-1]['id'] if has_next and trainers else None
+    }
+    if include_total:
+        result['total'] = db.session.query(func.count(TrainerProfile.id)).scalar()
+    
+    return jsonify(result), 200
+
+
+def _project_trainer(row):
+    """List entry from a trainer column row, formatted like TrainerProfile.to_dict()."""
+    trainer = dict(row)
+    for key in ('date_of_birth', 'hire_date', 'created_at', 'updated_at'):
+        if trainer.get(key) is not None:
+            trainer[key] = trainer[key].isoformat()
+    if 'salary_rate' in trainer:
+        trainer['salary_rate'] = float(trainer['salary_rate'])
+    if 'username' in trainer and trainer['username'] is None:
+        del trainer['username']
+    return trainer
 
 
 @admin_complete_bp.route('/trainers/<trainer_id>', methods=['GET'])
 @require_admin
 def get_trainer(trainer_id):
     """Get a specific trainer by ID."""
-    trainer = TrainerProfile.query.get(trainer_id)
+    trainer = db.session.get(TrainerProfile, trainer_id, options=[joinedload(TrainerProfile.user)])
     if not trainer:
         return jsonify({'error': 'Trainer not found'}), 404
     
     trainer_dict = trainer.to_dict()
-    user = User.query.get(trainer.user_id)
-    if user:
-        trainer_dict['username'] = user.username
+    if trainer.user:
+        trainer_dict['username'] = trainer.user.username
     
     return jsonify(trainer_dict), 200
 
@@ -768,34 +892,29 @@ def create_trainer():
     data = request.get_json()
     
     # Validate required fields (no username/password needed)
-    required_fields = ['specialization', 'phone', 'email']
-    for field in required_fields:
-        if not data.get(field):
-            return jsonify({'error': f'Missing required field: {field}'}), 400
+    missing = _first_missing_field(data, TRAINER_REQUIRED_FIELDS)
+    if missing:
+        return jsonify({'error': f'Missing required field: {missing}'}), 400
+    
+    try:
+        dob = _parse_request_date(data, 'date_of_birth')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     try:
         # Create user with auto-generated username (email-based)
-        auto_username = data['email'].split('@')[0] + '_' + str(uuid.uuid4())[:8]
-        auto_password = str(uuid.uuid4())
+        auto_username = data['email'].split('@', 1)[0] + '_' + secrets.token_urlsafe(6)
+        auto_password = secrets.token_urlsafe(24)
         
         user = User(
             username=auto_username,
-            password_hash=PasswordService.hash_password(auto_password),
+            password_hash=PasswordService.hash_generated_password(auto_password),
             role=UserRole.TRAINER,
             is_active=True
         )
         db.session.add(user)
         db.session.flush()
         
-        # Parse date_of_birth if provided
-        dob = None
-        if data.get('date_of_birth'):
-            try:
-                from datetime import datetime as dt
-                dob = dt.strptime(data['date_of_birth'], '%Y-%m-%d').date()
-            except:
-                dob = None
-        
         # Create trainer profile
         trainer = TrainerProfile(
             user_id=user.id,
@@ -825,12 +944,18 @@ def create_trainer():
 @require_admin
 def update_trainer(trainer_id):
     """Update a trainer."""
-    trainer = TrainerProfile.query.get(trainer_id)
+    trainer = db.session.get(TrainerProfile, trainer_id, options=[joinedload(TrainerProfile.user)])
     if not trainer:
         return jsonify({'error': 'Trainer not found'}), 404
     
     data = request.get_json()
     
+    # Dates are checked before any field changes
+    try:
+        dates = {field: _parse_request_date(data, field) for field in ('date_of_birth',) if field in data}
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Update trainer profile fields
         if 'full_name' in data:
@@ -845,12 +970,8 @@ def update_trainer(trainer_id):
             trainer.bio = data['bio']
         if 'gender' in data:
             trainer.gender = data['gender']
-        if 'date_of_birth' in data:
-            try:
-                from datetime import datetime as dt
-                trainer.date_of_birth = dt.strptime(data['date_of_birth'], '%Y-%m-%d').date() if data['date_of_birth'] else None
-            except:
-                pass
+        if 'date_of_birth' in dates:
+            trainer.date_of_birth = dates['date_of_birth']
         if 'cnic' in data:
             trainer.cnic = data['cnic']
         if 'salary_rate' in data:
@@ -861,9 +982,8 @@ def update_trainer(trainer_id):
         db.session.commit()
         
         trainer_dict = trainer.to_dict()
-        user = User.query.get(trainer.user_id)
-        if user:
-            trainer_dict['username'] = user.username
+        if trainer.user:
+            trainer_dict['username'] = trainer.user.username
         
         return jsonify(trainer_dict), 200
         
@@ -883,12 +1003,12 @@ def update_trainer_fixed(trainer_id):
 @require_admin
 def delete_trainer(trainer_id):
     """Delete a trainer."""
-    trainer = TrainerProfile.query.get(trainer_id)
+    trainer = db.session.get(TrainerProfile, trainer_id, options=[joinedload(TrainerProfile.user)])
     if not trainer:
         return jsonify({'error': 'Trainer not found'}), 404
     
     try:
-        user = User.query.get(trainer.user_id)
+        user = trainer.user
         db.session.delete(trainer)
         if user:
             db.session.delete(user)
@@ -907,6 +1027,7 @@ def delete_trainer(trainer_id):
 
 @admin_complete_bp.route('/dashboard/metrics', methods=['GET'])
 @require_admin
+@cached_json('admin:dash:metrics')
 def get_dashboard_metrics():
     """Get dashboard metrics (without attendance data)."""
     try:
@@ -915,7 +1036,6 @@ def get_dashboard_metrics():
         
         # Overdue payments - count PENDING transactions where due_date < now
         # EXCLUDE transactions for frozen members
-        from datetime import datetime
         now = datetime.utcnow()
         
         # Get all overdue transactions
@@ -927,7 +1047,7 @@ def get_dashboard_metrics():
         # Filter out transactions for frozen members
         overdue_payments_count = 0
         for transaction in overdue_transactions:
-            member = MemberProfile.query.get(transaction.member_id)
+            member = db.session.get(MemberProfile, transaction.member_id)
             if member and not member.is_frozen:
                 overdue_payments_count += 1
         
@@ -954,8 +1074,14 @@ def get_dashboard_metrics():
 
 @admin_complete_bp.route('/settings', methods=['GET'])
 @require_admin
+@cached_json('admin:settings')
 def get_admin_settings():
-    """Get system settings."""
+    """
+    Get system settings.
+    
+    The settings row rarely changes, so the response is cached for a minute;
+    update_admin_settings drops it straight away.
+    """
     from models.settings import Settings
     
     try:
@@ -997,6 +1123,7 @@ def update_admin_settings():
             settings.admission_fee = float(data['admission_fee'])
         
         db.session.commit()
+        invalidate_cached_responses('admin:settings')
         
         return jsonify({
             'message': 'Settings updated successfully',
@@ -1015,7 +1142,7 @@ def update_admin_profile():
     from flask_jwt_extended import get_jwt_identity
     
     user_id = get_jwt_identity()
-    user = User.query.get(user_id)
+    user = db.session.get(User, user_id)
     
     if not user:
         return jsonify({'error': 'User not found'}), 404
@@ -1023,20 +1150,22 @@ def update_admin_profile():
     data = request.get_json()
     
     try:
-        # Update password if provided
-        if 'current_password' in data and 'new_password' in data:
+        update_password = 'current_password' in data and 'new_password' in data
+        if update_password:
             if not PasswordService.verify_password(data['current_password'], user.password_hash):
                 return jsonify({'error': 'Current password is incorrect'}), 400
-            
-            user.password_hash = PasswordService.hash_password(data['new_password'])
         
         # Update username if provided
         if 'username' in data and data['username'] != user.username:
-            existing = User.query.filter_by(username=data['username']).first()
+            existing = db.session.query(User.id).filter_by(username=data['username']).first()
             if existing:
                 return jsonify({'error': 'Username already exists'}), 400
             user.username = data['username']
         
+        # Hash last: the bcrypt work is only spent once the update will succeed
+        if update_password:
+            user.password_hash = PasswordService.hash_password(data['new_password'])
+        
         db.session.commit()
         
         return jsonify({
@@ -1056,29 +1185,25 @@ def update_admin_profile():
 
 @admin_complete_bp.route('/dashboard/revenue-projection', methods=['GET'])
 @require_admin
+@cached_json('admin:dash:revenue-projection')
 def get_revenue_projection():
     """Get revenue projection data based on active member packages."""
     try:
-        # Get all active members (not frozen) with packages
-        active_members = MemberProfile.query.filter(
-            MemberProfile.is_frozen == False,
-            MemberProfile.current_package_id.isnot(None)
-        ).all()
-        
-        projected_monthly_revenue = 0
-        active_packages_count = 0
+        # Monthly-equivalent price of every live package, summed in SQL: member
+        # not frozen, package active, and no expiry or expiry still ahead
         now = datetime.now()
-        
-        for member in active_members:
-            # Check if package is still active (not expired or no expiry date set)
-            if member.package_expiry_date is None or member.package_expiry_date >= now:
-                package = Package.query.get(member.current_package_id)
-                if package and package.is_active:
-                    # Calculate monthly revenue based on package duration
-                    if package.duration_days > 0:
-                        monthly_rate = (float(package.price) / package.duration_days) * 30
-                        projected_monthly_revenue += monthly_rate
-                        active_packages_count += 1
+        projected_monthly_revenue, active_packages_count = db.session.query(
+            func.coalesce(func.sum(Package.price * 30.0 / Package.duration_days), 0),
+            func.count(MemberProfile.id)
+        ).select_from(MemberProfile).join(
+            Package, MemberProfile.current_package_id == Package.id
+        ).filter(
+            MemberProfile.is_frozen == False,
+            Package.is_active == True,
+            Package.duration_days > 0,
+            or_(MemberProfile.package_expiry_date.is_(None), MemberProfile.package_expiry_date >= now)
+        ).one()
+        projected_monthly_revenue = float(projected_monthly_revenue)
         
         return jsonify({
             'projected_monthly_revenue': round(projected_monthly_revenue, 2),
@@ -1095,33 +1220,35 @@ def get_revenue_projection():
 
 @admin_complete_bp.route('/dashboard/revenue-trend', methods=['GET'])
 @require_admin
+@cached_json('admin:dash:revenue-trend')
 def get_revenue_trend():
     """Get revenue trend data."""
     try:
-        from datetime import datetime, timedelta
-        
-        # Get last 6 months of revenue
+        # Last 6 months, oldest first; all windows are summed in one query
         months = []
-        revenue = []
-        
-        for i in range(6):
-            month_date = datetime.now() - timedelta(days=30*i)
-            months.insert(0, month_date.strftime('%b'))
+        windows = []
+        now = datetime.now()
+        for i in range(5, -1, -1):
+            month_date = now - timedelta(days=30*i)
+            months.append(month_date.strftime('%b'))
             
-            # Calculate revenue for this month
             month_start = month_date.replace(day=1)
             if i > 0:
                 next_month = (month_date.replace(day=28) + timedelta(days=4)).replace(day=1)
             else:
-                next_month = datetime.now()
-            
-            month_revenue = db.session.query(func.sum(Transaction.amount)).filter(
-                Transaction.status == TransactionStatus.COMPLETED,
-                Transaction.paid_date >= month_start,
-                Transaction.paid_date < next_month
-            ).scalar() or 0
-            
-            revenue.insert(0, float(month_revenue))
+                next_month = now
+            windows.append((month_start, next_month))
+        
+        sums = db.session.query(*[
+            func.sum(case(
+                (and_(Transaction.paid_date >= start, Transaction.paid_date < end), Transaction.amount)
+            ))
+            for start, end in windows
+        ]).filter(
+            Transaction.status == TransactionStatus.COMPLETED,
+            Transaction.paid_date >= min(start for start, _ in windows)
+        ).one()
+        revenue = [float(total or 0) for total in sums]
         
         return jsonify({
             'months': months,
@@ -1136,18 +1263,17 @@ def get_revenue_trend():
 def get_daily_revenue():
     """Get daily revenue data for the last 30 days."""
     try:
-        from datetime import datetime, timedelta
-        
         # Get last 30 days of revenue
         days = []
         revenue = []
+        # Read the clock once so every day is measured from the same midnight
+        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
         for i in range(30):
-            day_date = datetime.now() - timedelta(days=29-i)
-            days.append(day_date.strftime('%d %b'))
+            day_start = today_start - timedelta(days=29-i)
+            days.append(day_start.strftime('%d %b'))
             
             # Calculate revenue for this day
-            day_start = day_date.replace(hour=0, minute=0, second=0, microsecond=0)
             day_end = day_start + timedelta(days=1)
             
             day_revenue = db.session.query(func.sum(Transaction.amount)).filter(
@@ -1169,29 +1295,27 @@ def get_daily_revenue():
 
 @admin_complete_bp.route('/dashboard/member-growth', methods=['GET'])
 @require_admin
+@cached_json('admin:dash:member-growth')
 def get_member_growth():
     """Get member growth data."""
     try:
-        from datetime import datetime, timedelta
-        
-        # Get last 6 months of member growth
+        # Members created before the end of each of the last 6 months, oldest
+        # first; all cut-offs are counted in one query
         months = []
-        counts = []
-        
-        for i in range(6):
-            month_date = datetime.now() - timedelta(days=30*i)
-            months.insert(0, month_date.strftime('%b'))
-            
-            # Count members created up to this month
+        month_ends = []
+        now = datetime.now()
+        for i in range(5, -1, -1):
+            month_date = now - timedelta(days=30*i)
+            months.append(month_date.strftime('%b'))
             month_end = month_date.replace(day=28) + timedelta(days=4)
-            month_end = month_end.replace(day=1)
-            
-            count = User.query.filter(
-                User.role == UserRole.MEMBER,
-                User.created_at < month_end
-            ).count()
-            
-            counts.insert(0, count)
+            month_ends.append(month_end.replace(day=1))
+        
+        counts = list(db.session.query(*[
+            func.count(case((User.created_at < month_end, 1)))
+            for month_end in month_ends
+        ]).filter(
+            User.role == UserRole.MEMBER
+        ).one())
         
         return jsonify({
             'months': months,
@@ -1206,14 +1330,13 @@ def get_member_growth():
 def get_attendance_trend():
     """Get attendance trend data (returns empty since attendance was removed)."""
     try:
-        from datetime import datetime, timedelta
-        
         # Return empty data since attendance was removed
         months = []
         attendance_count = []
+        now = datetime.now()
         
         for i in range(6):
-            month_date = datetime.now() - timedelta(days=30*i)
+            month_date = now - timedelta(days=30*i)
             months.insert(0, month_date.strftime('%b'))
             attendance_count.insert(0, 0)
         
@@ -1253,76 +1376,104 @@ def get_peak_hours():
 @admin_complete_bp.route('/finance/member-payments-fixed', methods=['GET'])
 @require_admin
 def get_member_payments_fixed():
-    """Get all transactions with proper status calculation."""
+    """
+    Get all transactions with proper status calculation.
+    
+    The ``{"payments": [...]}`` body is streamed in batches as rows are read,
+    so memory stays flat however many transactions there are.
+    """
     try:
-        # Get all transactions
-        transactions = Transaction.query.all()
-        
-        payments = []
-        for transaction in transactions:
-            try:
-                member = MemberProfile.query.get(transaction.member_id)
-                if not member:
-                    continue
-                
-                user = User.query.get(member.user_id)
-                username = user.username if user else 'Unknown'
-                
-                # Calculate status based on transaction state and dates
-                status = transaction.status.value
-                
-                # If not completed, check if overdue
-                if status != 'COMPLETED' and transaction.due_date:
-                    if datetime.utcnow() > transaction.due_date:
-                        status = 'OVERDUE'
-                
-                # Safely get trainer_fee and discount_amount
-                trainer_fee = 0
-                discount_amount = 0
-                package_price = 0
-                try:
-                    trainer_fee = float(transaction.trainer_fee) if transaction.trainer_fee else 0
-                except (TypeError, ValueError):
-                    trainer_fee = 0
-                
-                try:
-                    discount_amount = float(transaction.discount_amount) if transaction.discount_amount else 0
-                except (TypeError, ValueError):
-                    discount_amount = 0
-                
-                try:
-                    package_price = float(transaction.package_price) if transaction.package_price else 0
-                except (TypeError, ValueError):
-                    package_price = 0
-                
-                payments.append({
-                    'id': transaction.id,
-                    'member_id': transaction.member_id,
-                    'username': username,
-                    'full_name': member.full_name,
-                    'phone': member.phone,
-                    'amount': float(transaction.amount),
-                    'transaction_type': transaction.transaction_type.value if hasattr(transaction.transaction_type, 'value') else str(transaction.transaction_type),
-                    'status': status,
-                    'due_date': transaction.due_date.isoformat() + 'Z' if transaction.due_date else None,
-                    'paid_date': transaction.paid_date.isoformat() + 'Z' if transaction.paid_date else None,
-                    'created_at': transaction.created_at.isoformat() + 'Z',
-                    'total_monthly_payment': float(transaction.amount),
-                    'trainer_fee': trainer_fee,
-                    'package_price': package_price,
-                    'discount_amount': discount_amount,
-                    'discount_type': transaction.discount_type or 'fixed',
-                    'is_reversed': getattr(transaction, 'is_reversed', False),
-                    'reversed_at': transaction.reversed_at.isoformat() + 'Z' if hasattr(transaction, 'reversed_at') and transaction.reversed_at else None,
-                    'reversed_by': getattr(transaction, 'reversed_by', None),
-                    'description': getattr(transaction, 'description', None)
-                })
-            except Exception as item_error:
-                continue
-        
-        return jsonify({'payments': payments}), 200
+        # One joined pass over transactions, members and users; the overdue
+        # flag is derived in SQL and rows are streamed in batches
+        is_overdue = case(
+            (and_(
+                Transaction.status != TransactionStatus.COMPLETED,
+                Transaction.due_date.isnot(None),
+                Transaction.due_date < datetime.utcnow()
+            ), True),
+            else_=False
+        )
+        # Plain column rows (no Transaction objects or identity map) as mappings
+        rows = iter(db.session.execute(
+            select(
+                Transaction.id,
+                Transaction.member_id,
+                Transaction.amount,
+                Transaction.transaction_type,
+                Transaction.status,
+                Transaction.due_date,
+                Transaction.paid_date,
+                Transaction.created_at,
+                Transaction.trainer_fee,
+                Transaction.package_price,
+                Transaction.discount_amount,
+                Transaction.discount_type,
+                Transaction.is_reversed,
+                Transaction.reversed_at,
+                Transaction.reversed_by,
+                Transaction.description,
+                MemberProfile.full_name,
+                MemberProfile.phone,
+                User.username,
+                is_overdue.label('is_overdue')
+            ).join(
+                MemberProfile, Transaction.member_id == MemberProfile.id
+            ).outerjoin(
+                User, MemberProfile.user_id == User.id
+            ).execution_options(yield_per=PAYMENTS_STREAM_BATCH)
+        ).mappings())
+        # Run the query before streaming starts so DB errors still return a 500
+        first_row = next(rows, None)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    
+    def generate():
+        yield b'{"payments":['
+        separator = b''
+        batch = []
+        remaining = rows if first_row is None else chain((first_row,), rows)
+        for row in remaining:
+            try:
+                # Datetimes are serialized by orjson as UTC ISO strings ('Z')
+                batch.append(utc_json_dumps(_payment_dict(row)))
+            except Exception:
+                continue
+            if len(batch) >= PAYMENTS_STREAM_BATCH:
+                yield separator + b','.join(batch)
+                separator = b','
+                batch = []
+        if batch:
+            yield separator + b','.join(batch)
+        yield b']}'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def _payment_dict(row):
+    """Payment row for get_member_payments_fixed (datetimes left for the serializer)."""
+    transaction_type = row['transaction_type']
+    return {
+        'id': row['id'],
+        'member_id': row['member_id'],
+        'username': row['username'] or 'Unknown',
+        'full_name': row['full_name'],
+        'phone': row['phone'],
+        'amount': float(row['amount']),
+        'transaction_type': transaction_type.value if hasattr(transaction_type, 'value') else str(transaction_type),
+        'status': 'OVERDUE' if row['is_overdue'] else row['status'].value,
+        'due_date': row['due_date'],
+        'paid_date': row['paid_date'],
+        'created_at': row['created_at'],
+        'total_monthly_payment': float(row['amount']),
+        'trainer_fee': float(row['trainer_fee']) if row['trainer_fee'] else 0,
+        'package_price': float(row['package_price']) if row['package_price'] else 0,
+        'discount_amount': float(row['discount_amount']) if row['discount_amount'] else 0,
+        'discount_type': row['discount_type'] or 'fixed',
+        'is_reversed': row['is_reversed'],
+        'reversed_at': row['reversed_at'],
+        'reversed_by': row['reversed_by'],
+        'description': row['description']
+    }
 
 
 @admin_complete_bp.route('/finance/transactions/<transaction_id>/mark-paid', methods=['POST'])
@@ -1332,63 +1483,25 @@ def mark_transaction_paid(transaction_id):
     try:
         data = request.get_json() or {}
         
-        transaction = Transaction.query.get(transaction_id)
+        transaction = db.session.get(Transaction, transaction_id)
         if not transaction:
             return jsonify({'error': 'Transaction not found'}), 404
         
         # Get member info
-        member = MemberProfile.query.get(transaction.member_id)
+        member = db.session.get(MemberProfile, transaction.member_id)
         if not member:
             return jsonify({'error': 'Member not found'}), 404
         
-        # Update transaction status and paid date
-        transaction.status = TransactionStatus.COMPLETED
-        transaction.paid_date = datetime.utcnow()
-        
-        # Add optional description (e.g., "Paid half", "Partial payment", etc.)
-        if 'description' in data and data['description']:
-            transaction.description = data['description'].strip()
-        
-        # If this is an admission fee, mark admission_fee_paid on member
-        if transaction.transaction_type.value == 'ADMISSION':
-            if member:
-                member.admission_fee_paid = True
-        
-        # Create next month's transaction automatically (only for MONTHLY type or if member has active package)
-        # Don't create for frozen members
+        # IMPORTANT: Always fetch fresh package and trainer data to ensure correct pricing
+        # This prevents using cached/old prices if package was changed
+        package = trainer = None
         if not member.is_frozen and member.current_package_id:
-            # IMPORTANT: Always fetch fresh package and trainer data to ensure correct pricing
-            # This prevents using cached/old prices if package was changed
-            package = Package.query.get(member.current_package_id)
-            if package and package.is_active:
-                # Calculate next month's due date (30 days from current due date)
-                next_due_date = transaction.due_date + timedelta(days=30) if transaction.due_date else datetime.utcnow() + timedelta(days=30)
-                
-                # Get trainer fee if trainer is assigned (fetch fresh data)
-                trainer_fee = 0
-                if member.trainer_id:
-                    trainer = TrainerProfile.query.get(member.trainer_id)
-                    if trainer:
-                        trainer_fee = float(trainer.salary_rate) if trainer.salary_rate else 0
-                
-                # Calculate total amount using CURRENT package price (not old transaction price)
-                package_price = float(package.price) if package.price else 0
-                total_amount = package_price + trainer_fee
-                
-                # Create new transaction for next month
-                new_transaction = Transaction(
-                    member_id=member.id,
-                    amount=total_amount,
-                    transaction_type=TransactionType.PAYMENT,
-                    status=TransactionStatus.PENDING,
-                    due_date=next_due_date,
-                    trainer_fee=trainer_fee,
-                    package_price=package_price,
-                    discount_amount=0,
-                    discount_type='fixed',
-                    created_at=datetime.utcnow()
-                )
-                db.session.add(new_transaction)
+            package = db.session.get(Package, member.current_package_id)
+            if package and package.is_active and member.trainer_id:
+                trainer = db.session.get(TrainerProfile, member.trainer_id)
+        
+        # Optional description, e.g. "Paid half" or "Partial payment"
+        _complete_transaction(transaction, member, package, trainer, data.get('description'))
         
         db.session.commit()
         
@@ -1401,6 +1514,108 @@ def mark_transaction_paid(transaction_id):
         return jsonify({'error': str(e)}), 500
 
 
+@admin_complete_bp.route('/finance/transactions/mark-paid-batch', methods=['POST'])
+@require_admin
+def mark_transactions_paid_batch():
+    """
+    Mark several transactions as paid in one request and one commit.
+    
+    Body: {"ids": [...], "description": optional}. Each transaction gets the
+    same side effects as mark_transaction_paid (admission flag, next month's
+    transaction). Unknown ids, or ids whose member no longer exists, are
+    returned in ``not_found``; transactions that were already COMPLETED are
+    left untouched and returned in ``already_paid``, so a retried request
+    doesn't create a second follow-up transaction.
+    """
+    data = request.get_json() or {}
+    ids = data.get('ids')
+    if not isinstance(ids, list) or not ids or not all(isinstance(i, str) for i in ids):
+        return jsonify({'error': 'ids must be a non-empty list of transaction ids'}), 400
+    if len(ids) > MARK_PAID_BATCH_LIMIT:
+        return jsonify({'error': f'At most {MARK_PAID_BATCH_LIMIT} ids per request'}), 400
+    
+    try:
+        ids = list(dict.fromkeys(ids))
+        # Transactions joined to their members; every package and trainer the
+        # batch needs comes from one IN query each, not a lookup per transaction
+        member_loader = joinedload(Transaction.member)
+        transactions = Transaction.query.options(
+            member_loader.selectinload(MemberProfile.package),
+            member_loader.selectinload(MemberProfile.trainer)
+        ).filter(Transaction.id.in_(ids)).with_for_update(of=Transaction).all()
+        
+        updated = []
+        already_paid = []
+        for transaction in transactions:
+            member = transaction.member
+            if not member:
+                continue
+            if transaction.status == TransactionStatus.COMPLETED:
+                already_paid.append(transaction.id)
+                continue
+            _complete_transaction(transaction, member, member.package, member.trainer, data.get('description'))
+            updated.append(transaction.id)
+        
+        db.session.commit()
+        
+        found = set(updated) | set(already_paid)
+        return jsonify({
+            'updated': updated,
+            'already_paid': already_paid,
+            'not_found': [i for i in ids if i not in found]
+        }), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
+def _complete_transaction(transaction, member, package, trainer, description=None):
+    """
+    Mark a transaction paid and queue its follow-up changes on the session.
+    
+    Sets the admission flag for admission fees and, for unfrozen members on an
+    active package, adds next month's PENDING transaction priced from the
+    current package and trainer. The caller commits.
+    """
+    now = datetime.utcnow()
+    transaction.status = TransactionStatus.COMPLETED
+    transaction.paid_date = now
+    
+    if description:
+        transaction.description = description.strip()
+    
+    # If this is an admission fee, mark admission_fee_paid on member
+    if transaction.transaction_type.value == 'ADMISSION':
+        member.admission_fee_paid = True
+    
+    # Create next month's transaction automatically; not for frozen members
+    if member.is_frozen or not member.current_package_id:
+        return
+    if not package or not package.is_active:
+        return
+    
+    # Calculate next month's due date (30 days from current due date)
+    next_due_date = transaction.due_date + timedelta(days=30) if transaction.due_date else now + timedelta(days=30)
+    
+    trainer_fee = float(trainer.salary_rate) if trainer and trainer.salary_rate else 0
+    
+    # Calculate total amount using CURRENT package price (not old transaction price)
+    package_price = float(package.price) if package.price else 0
+    
+    db.session.add(Transaction(
+        member_id=member.id,
+        amount=package_price + trainer_fee,
+        transaction_type=TransactionType.PAYMENT,
+        status=TransactionStatus.PENDING,
+        due_date=next_due_date,
+        trainer_fee=trainer_fee,
+        package_price=package_price,
+        discount_amount=0,
+        discount_type='fixed',
+        created_at=now
+    ))
+
+
 @admin_complete_bp.route('/finance/transactions/<transaction_id>/reverse-payment', methods=['POST'])
 @require_admin
 def reverse_transaction_payment(transaction_id):
@@ -1408,7 +1623,7 @@ def reverse_transaction_payment(transaction_id):
     try:
         from flask import g
         
-        transaction = Transaction.query.get(transaction_id)
+        transaction = db.session.get(Transaction, transaction_id)
         if not transaction:
             return jsonify({'error': 'Transaction not found'}), 404
         
@@ -1424,7 +1639,7 @@ def reverse_transaction_payment(transaction_id):
                 return jsonify({'error': 'Transaction can only be reversed within 24 hours of payment'}), 400
         
         # Get member info
-        member = MemberProfile.query.get(transaction.member_id)
+        member = db.session.get(MemberProfile, transaction.member_id)
         if not member:
             return jsonify({'error': 'Member not found'}), 404
         
@@ -1486,7 +1701,6 @@ def list_trainers_fixed():
 # ============================================================================
 
 @admin_complete_bp.route('/change-password', methods=['POST'])
-@jwt_required()
 @require_admin
 def change_password():
     """Change admin password."""
@@ -1507,7 +1721,7 @@ def change_password():
         
         # Get current user
         user_id = get_jwt_identity()
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         
         if not user:
             return jsonify({'error': 'User not found'}), 404
@@ -40,15 +40,14 @@ def sync_log_from_local():
             return jsonify({'error': 'Missing required fields'}), 400
         
         # Parse timestamp and ensure it's UTC
-        from datetime import timezone as tz
         timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
         
         # If timestamp is naive (no timezone), assume it's UTC
         if timestamp.tzinfo is None:
-            timestamp = timestamp.replace(tzinfo=tz.utc)
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
         
         # Convert to UTC if it has a different timezone
-        timestamp = timestamp.astimezone(tz.utc)
+        timestamp = timestamp.astimezone(timezone.utc)
         
         current_app.logger.info(f"Parsed timestamp: {timestamp} (UTC)")
         
@@ -123,11 +122,10 @@ def sync_log_from_local():
                         pusher_data['package_start_date'] = member.package_start_date.isoformat() if member.package_start_date else None
                         
                         if member.package_expiry_date:
-                            from datetime import timezone as tz
-                            now = datetime.now(tz.utc)
+                            now = datetime.now(timezone.utc)
                             expiry = member.package_expiry_date
                             if expiry.tzinfo is None:
-                                expiry = expiry.replace(tzinfo=tz.utc)
+                                expiry = expiry.replace(tzinfo=timezone.utc)
                             
                             days_left = (expiry - now).days
                             pusher_data['package_expiry_date'] = member.package_expiry_date.isoformat()
@@ -167,8 +165,7 @@ def sync_log_from_local():
 @jwt_required()
 def get_today_attendance():
     try:
-        from datetime import timezone as tz
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         
         query = AttendanceRecord.query.filter(func.date(AttendanceRecord.check_in_time) == today)
@@ -319,8 +316,7 @@ def get_currently_inside():
 def get_daily_summary():
     """Get today's attendance summary with timezone-aware date handling."""
     try:
-        from datetime import timezone as tz
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         
         current_app.logger.info(f"Daily summary requested for date: {today} (UTC: {now_utc})")
@@ -372,11 +368,10 @@ def get_daily_summary():
                     if member:
                         # Check if membership is active
                         if member.package_expiry_date:
-                            from datetime import timezone as tz
-                            now = datetime.now(tz.utc)
+                            now = datetime.now(timezone.utc)
                             expiry = member.package_expiry_date
                             if expiry.tzinfo is None:
-                                expiry = expiry.replace(tzinfo=tz.utc)
+                                expiry = expiry.replace(tzinfo=timezone.utc)
                             
                             if expiry < now:
                                 payment_status = 'EXPIRED'
@@ -419,8 +414,7 @@ def get_daily_summary():
 def get_dashboard_summary():
     try:
         # Use timezone-aware datetime for accurate date comparison
-        from datetime import timezone as tz
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         
         # Log for debugging
@@ -463,9 +457,8 @@ def get_dashboard_summary():
 @jwt_required()
 def get_weekly_analytics():
     try:
-        from datetime import timezone as tz
         week_offset = request.args.get('week_offset', 0, type=int)
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         week_start = today - timedelta(days=today.weekday()) - timedelta(weeks=week_offset)
         week_end = week_start + timedelta(days=6)
@@ -481,9 +474,8 @@ def get_weekly_analytics():
 @jwt_required()
 def get_monthly_analytics():
     try:
-        from datetime import timezone as tz
         month_offset = request.args.get('month_offset', 0, type=int)
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         month_start = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
         for _ in range(month_offset):
@@ -504,10 +496,9 @@ def get_monthly_analytics():
 @jwt_required()
 def get_top_members():
     try:
-        from datetime import timezone as tz
         limit = request.args.get('limit', 10, type=int)
         month_offset = request.args.get('month_offset', 0, type=int)
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         month_start = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
         for _ in range(month_offset):
@@ -541,9 +532,8 @@ def get_top_members():
 @jwt_required()
 def get_average_stay():
     try:
-        from datetime import timezone as tz
         period = request.args.get('period', 'day')
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         start_date = today if period == 'day' else (today - timedelta(days=today.weekday()) if period == 'week' else today.replace(day=1))
         records = db.session.query(AttendanceRecord).filter(and_(func.date(AttendanceRecord.check_in_time) >= start_date, AttendanceRecord.check_out_time.isnot(None))).all()
@@ -560,12 +550,11 @@ def get_average_stay():
 def get_monthly_attendance_records():
     """Get monthly attendance records for all members/trainers with aggregated stats."""
     try:
-        from datetime import timezone as tz
         # Get month parameter (default to current month)
         month_offset = request.args.get('month_offset', 0, type=int)
         search_query = request.args.get('search', '').strip().lower()
         
-        now_utc = datetime.now(tz.utc)
+        now_utc = datetime.now(timezone.utc)
         today = now_utc.date()
         # Calculate month start
         month_start = today.replace(day=1)
@@ -1,9 +1,12 @@
 """Authentication routes."""
+import secrets
+from datetime import datetime, timedelta
 from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from models.user import User, UserRole
 from services.auth_service import AuthService
 from services.password_service import PasswordService
+from database import db
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -142,10 +145,6 @@ def forgot_password():
     target_email = RECOVERY_EMAILS[recovery_key]
 
     try:
-        import secrets
-        from datetime import datetime, timedelta
-        from database import db
-
         # Find the admin user
         admin_user = User.query.filter_by(role=UserRole.ADMIN).first()
         if not admin_user:
@@ -173,7 +172,6 @@ def forgot_password():
             return jsonify({'error': 'Failed to send email. Check SMTP configuration.'}), 500
 
     except Exception as e:
-        from database import db
         db.session.rollback()
         current_app.logger.error(f"Forgot password error: {str(e)}")
         return jsonify({'error': 'Server error. Please try again.'}), 500
@@ -215,7 +213,6 @@ def reset_password():
             return jsonify({'error': 'Invalid or expired token'}), 401
         
         # Check if token is expired
-        from datetime import datetime
         if not user.reset_token_expiry or user.reset_token_expiry < datetime.utcnow():
             return jsonify({'error': 'Invalid or expired token'}), 401
         
@@ -226,13 +223,11 @@ def reset_password():
         user.reset_token = None
         user.reset_token_expiry = None
         
-        from database import db
         db.session.commit()
         
         return jsonify({'message': 'Password reset successfully'}), 200
         
     except Exception as e:
-        from database import db
         db.session.rollback()
         current_app.logger.error(f"Password reset error: {str(e)}")
         return jsonify({'error': 'Failed to reset password'}), 500
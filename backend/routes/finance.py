@@ -1,17 +1,23 @@
 """Finance routes."""
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.transaction import Transaction, TransactionStatus, TransactionType
 from models.member_profile import MemberProfile
 from models.package import Package
 from models.user import User
 from middleware.rbac import require_admin
+from utils.response_cache import cached_count, cached_json
+from utils.formatters import parse_utc_iso
+from utils.json_provider import utc_json_dumps
 from database import db
 from datetime import datetime, date
-from sqlalchemy import func
+from sqlalchemy import func, or_, update
 
 finance_bp = Blueprint('finance', __name__)
 
+# Pages larger than this are streamed in batches of this many rows
+TRANSACTIONS_STREAM_BATCH = 500
+
 
 # ============================================================================
 # FINANCE ENDPOINTS
@@ -27,7 +33,7 @@ def list_transactions():
         - status: Filter by status (PENDING, COMPLETED, OVERDUE)
         - member_id: Filter by member ID
         - page: Page number (default: 1)
-        - per_page: Items per page (default: 20)
+        - per_page: Items per page (default: 20; pages over 500 are streamed)
     
     Returns:
         - 200: {"transactions": [...], "total": count, "page": page, "per_page": per_page}
@@ -59,19 +65,48 @@ def list_transactions():
     # Order by created_at descending
     query = query.order_by(Transaction.created_at.desc())
     
-    # Apply pagination
-    paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Page 1 recounts, later pages reuse that total
+    total = cached_count(
+        f"count:transactions:{status.upper() if status else ''}:{member_id or ''}",
+        query,
+        refresh=page == 1
+    )
+    
+    if per_page > TRANSACTIONS_STREAM_BATCH:
+        return _stream_transactions(query, page, per_page, total)
     
+    paginated = query.paginate(page=page, per_page=per_page, error_out=False, count=False)
     transactions = [transaction.to_dict() for transaction in paginated.items]
     
     return jsonify({
         'transactions': transactions,
-        'total': paginated.total,
+        'total': total,
         'page': page,
         'per_page': per_page
     }), 200
 
 
+def _stream_transactions(query, page, per_page, total):
+    """Stream a large transactions page, serializing one batch of rows at a time."""
+    rows = query.offset((page - 1) * per_page).limit(per_page).yield_per(TRANSACTIONS_STREAM_BATCH)
+    
+    def generate():
+        yield b'{"transactions":['
+        separator = b''
+        batch = []
+        for transaction in rows:
+            batch.append(utc_json_dumps(transaction.to_dict()))
+            if len(batch) >= TRANSACTIONS_STREAM_BATCH:
+                yield separator + b','.join(batch)
+                separator = b','
+                batch = []
+        if batch:
+            yield separator + b','.join(batch)
+        yield f'],"total":{total},"page":{page},"per_page":{per_page}}}'.encode()
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
 @finance_bp.route('/transactions/<transaction_id>/mark-paid', methods=['POST'])
 @require_admin
 def mark_payment_received(transaction_id):
@@ -87,30 +122,34 @@ def mark_payment_received(transaction_id):
         - 200: {"id": "transaction_id", "status": "COMPLETED", "paid_date": "...", "timestamp": "..."}
         - 404: {"error": "Transaction not found"}
     """
-    transaction = Transaction.query.get(transaction_id)
-    
-    if not transaction:
-        return jsonify({'error': 'Transaction not found'}), 404
-    
     data = request.get_json() or {}
     
     # Parse paid_date if provided, otherwise use current time
     paid_date = datetime.utcnow()
     if 'paid_date' in data and data['paid_date']:
-        try:
-            paid_date = datetime.fromisoformat(data['paid_date'].replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
+        paid_date = parse_utc_iso(data['paid_date'])
+        if paid_date is None:
             return jsonify({'error': 'Invalid paid_date format'}), 400
     
     try:
-        transaction.status = TransactionStatus.COMPLETED
-        transaction.paid_date = paid_date
+        # One UPDATE ... RETURNING; no row back means the id doesn't exist
+        row = db.session.execute(
+            update(Transaction)
+            .where(Transaction.id == transaction_id)
+            .values(status=TransactionStatus.COMPLETED, paid_date=paid_date)
+            .returning(Transaction.id, Transaction.status, Transaction.paid_date)
+        ).first()
+        
+        if row is None:
+            db.session.rollback()
+            return jsonify({'error': 'Transaction not found'}), 404
+        
         db.session.commit()
         
         return jsonify({
-            'id': transaction.id,
-            'status': transaction.status.name,
-            'paid_date': transaction.paid_date.isoformat() if transaction.paid_date else None,
+            'id': row.id,
+            'status': row.status.name,
+            'paid_date': row.paid_date.isoformat() if row.paid_date else None,
             'timestamp': datetime.utcnow().isoformat()
         }), 200
     except Exception as e:
@@ -142,14 +181,15 @@ def get_overdue_payments():
     query = Transaction.query.filter_by(status=TransactionStatus.OVERDUE)
     query = query.order_by(Transaction.due_date.asc())
     
-    # Apply pagination
-    paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Apply pagination; page 1 recounts, later pages reuse that total
+    paginated = query.paginate(page=page, per_page=per_page, error_out=False, count=False)
+    total = cached_count('count:transactions:OVERDUE:', query, refresh=page == 1)
     
     overdue_payments = [transaction.to_dict() for transaction in paginated.items]
     
     return jsonify({
         'overdue_payments': overdue_payments,
-        'total': paginated.total,
+        'total': total,
         'page': page,
         'per_page': per_page
     }), 200
@@ -157,10 +197,14 @@ def get_overdue_payments():
 
 @finance_bp.route('/reports', methods=['GET'])
 @require_admin
+@cached_json('finance:reports')
 def get_financial_reports():
     """
     Get financial reports: total revenue, pending payments, overdue amounts.
     
+    Cached for a minute and dropped on any successful write, so repeated
+    dashboard loads do not re-aggregate the transactions table.
+    
     Returns:
         - 200: {
             "total_revenue": amount,
@@ -172,25 +216,18 @@ def get_financial_reports():
           }
     """
     try:
-        # Total revenue (completed transactions)
-        total_revenue = db.session.query(
-            func.sum(Transaction.amount)
-        ).filter_by(status=TransactionStatus.COMPLETED).scalar() or 0
-        
-        # Pending payments
-        pending_payments = db.session.query(
-            func.sum(Transaction.amount)
-        ).filter_by(status=TransactionStatus.PENDING).scalar() or 0
-        
-        # Overdue payments
-        overdue_payments = db.session.query(
-            func.sum(Transaction.amount)
-        ).filter_by(status=TransactionStatus.OVERDUE).scalar() or 0
-        
-        # Transaction counts
-        completed_count = Transaction.query.filter_by(status=TransactionStatus.COMPLETED).count()
-        pending_count = Transaction.query.filter_by(status=TransactionStatus.PENDING).count()
-        overdue_count = Transaction.query.filter_by(status=TransactionStatus.OVERDUE).count()
+        # Count and amount per status in a single grouped pass
+        totals = {
+            status: (count, amount)
+            for status, count, amount in db.session.query(
+                Transaction.status,
+                func.count(Transaction.id),
+                func.coalesce(func.sum(Transaction.amount), 0)
+            ).group_by(Transaction.status)
+        }
+        completed_count, total_revenue = totals.get(TransactionStatus.COMPLETED, (0, 0))
+        pending_count, pending_payments = totals.get(TransactionStatus.PENDING, (0, 0))
+        overdue_count, overdue_payments = totals.get(TransactionStatus.OVERDUE, (0, 0))
         
         return jsonify({
             'total_revenue': round(float(total_revenue), 2),
@@ -210,6 +247,7 @@ def get_financial_reports():
 
 @finance_bp.route('/settings', methods=['GET'])
 @require_admin
+@cached_json('finance:settings')
 def get_settings():
     """
     Get current settings (admission fees, package prices).
@@ -273,42 +311,55 @@ def update_settings():
         # Update admission fee if provided
         admission_fee = data.get('admission_fee')
         
-        # Update packages if provided
-        if 'packages' in data:
-            for package_data in data['packages']:
-                package = Package.query.get(package_data.get('id'))
-                if not package:
-                    return jsonify({'error': f"Package {package_data.get('id')} not found"}), 404
-                
-                # Validate price
-                try:
-                    price = float(package_data.get('price', package.price))
-                    if price < 0:
-                        return jsonify({'error': 'Package price must be non-negative'}), 400
-                except (ValueError, TypeError):
-                    return jsonify({'error': 'Package price must be a valid number'}), 400
-                
-                # Validate duration
-                try:
-                    duration = int(package_data.get('duration_days', package.duration_days))
-                    if duration <= 0:
-                        return jsonify({'error': 'Package duration must be positive'}), 400
-                except (ValueError, TypeError):
-                    return jsonify({'error': 'Package duration must be a valid integer'}), 400
-                
-                # Update package
-                package.name = package_data.get('name', package.name)
-                package.duration_days = duration
-                package.price = price
+        # Requested packages and the active ones returned below, in one query
+        packages_data = data.get('packages') or []
+        ids = [package_data.get('id') for package_data in packages_data]
+        packages = Package.query.filter(
+            or_(Package.id.in_(ids), Package.is_active.is_(True))
+        ).all()
+        packages_by_id = {package.id: package for package in packages}
+        
+        # Validate every entry before changing anything
+        updates = []
+        for package_data in packages_data:
+            package = packages_by_id.get(package_data.get('id'))
+            if not package:
+                return jsonify({'error': f"Package {package_data.get('id')} not found"}), 404
+            
+            # Validate price
+            try:
+                price = float(package_data.get('price', package.price))
+                if price < 0:
+                    return jsonify({'error': 'Package price must be non-negative'}), 400
+            except (ValueError, TypeError):
+                return jsonify({'error': 'Package price must be a valid number'}), 400
+            
+            # Validate duration
+            try:
+                duration = int(package_data.get('duration_days', package.duration_days))
+                if duration <= 0:
+                    return jsonify({'error': 'Package duration must be positive'}), 400
+            except (ValueError, TypeError):
+                return jsonify({'error': 'Package duration must be a valid integer'}), 400
+            
+            updates.append((package, package_data.get('name', package.name), duration, price))
+        
+        # Update packages; the flush sends the UPDATEs as one batch
+        for package, name, duration, price in updates:
+            package.name = name
+            package.duration_days = duration
+            package.price = price
+        db.session.flush()
         
+        # Serialize before commit expires the loaded packages
+        active_packages = [package.to_dict() for package in packages if package.is_active]
         db.session.commit()
         
         # Return updated settings
-        packages = Package.query.filter_by(is_active=True).all()
         return jsonify({
             'message': 'Settings updated successfully',
             'admission_fee': admission_fee or 0,
-            'packages': [package.to_dict() for package in packages]
+            'packages': active_packages
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -5,11 +5,18 @@ from models.package import Package
 from models.member_profile import MemberProfile
 from models.user import User, UserRole
 from middleware.rbac import require_admin
+from utils.response_cache import cached_count, cached_json
 from database import db
 from datetime import datetime, timedelta
+from collections import defaultdict
+from sqlalchemy import update
+from sqlalchemy.orm import joinedload, lazyload
 
 packages_bp = Blueprint('packages', __name__)
 
+# Roles allowed to see members grouped by package
+_TRAINER_ADMIN = frozenset((UserRole.TRAINER, UserRole.ADMIN))
+
 
 # ============================================================================
 # ADMIN PACKAGE CRUD ENDPOINTS
@@ -77,6 +84,7 @@ def create_package():
 
 @packages_bp.route('/', methods=['GET'])
 @jwt_required()
+@cached_json('packages:list', vary_on=('active_only', 'page', 'per_page'))
 def list_packages():
     """
     List all packages (All roles).
@@ -106,14 +114,15 @@ def list_packages():
     # Order by price ascending
     query = query.order_by(Package.price.asc())
     
-    # Apply pagination
-    paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Apply pagination; page 1 recounts, later pages reuse that total
+    paginated = query.paginate(page=page, per_page=per_page, error_out=False, count=False)
+    total = cached_count(f'count:packages:{active_only}', query, refresh=page == 1)
     
     packages = [package.to_dict() for package in paginated.items]
     
     return jsonify({
         'packages': packages,
-        'total': paginated.total,
+        'total': total,
         'page': page,
         'per_page': per_page
     }), 200
@@ -157,16 +166,12 @@ def update_package(package_id):
         - 404: {"error": "Package not found"}
         - 400: {"error": "Invalid input"}
     """
-    package = Package.query.get(package_id)
-    
-    if not package:
-        return jsonify({'error': 'Package not found'}), 404
-    
-    data = request.get_json()
+    data = request.get_json() or {}
+    values = {}
     
     # Update name if provided
     if 'name' in data:
-        package.name = data['name']
+        values['name'] = data['name']
     
     # Update duration_days if provided
     if 'duration_days' in data:
@@ -174,7 +179,7 @@ def update_package(package_id):
             duration_days = int(data['duration_days'])
             if duration_days <= 0:
                 return jsonify({'error': 'Duration must be positive'}), 400
-            package.duration_days = duration_days
+            values['duration_days'] = duration_days
         except (ValueError, TypeError):
             return jsonify({'error': 'Duration must be a valid integer'}), 400
     
@@ -184,21 +189,41 @@ def update_package(package_id):
             price = float(data['price'])
             if price <= 0:
                 return jsonify({'error': 'Price must be positive'}), 400
-            package.price = price
+            values['price'] = price
         except (ValueError, TypeError):
             return jsonify({'error': 'Price must be a valid number'}), 400
     
     # Update description if provided
     if 'description' in data:
-        package.description = data['description']
+        values['description'] = data['description']
     
     # Update is_active if provided
     if 'is_active' in data:
-        package.is_active = data['is_active']
+        values['is_active'] = data['is_active']
+    
+    if not values:
+        package = db.session.get(Package, package_id)
+        if not package:
+            return jsonify({'error': 'Package not found'}), 404
+        return jsonify(package.to_dict()), 200
     
     try:
+        # One UPDATE ... RETURNING; no row back means the id doesn't exist
+        package = db.session.scalars(
+            update(Package)
+            .where(Package.id == package_id)
+            .values(**values)
+            .returning(Package)
+        ).first()
+        
+        if package is None:
+            db.session.rollback()
+            return jsonify({'error': 'Package not found'}), 404
+        
+        # Serialize before commit expires the returned row
+        package_data = package.to_dict()
         db.session.commit()
-        return jsonify(package.to_dict()), 200
+        return jsonify(package_data), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
@@ -221,10 +246,12 @@ def delete_package(package_id):
     if not package:
         return jsonify({'error': 'Package not found'}), 404
     
-    # Check if any members are using this package
-    members_count = MemberProfile.query.filter_by(current_package_id=package_id).count()
+    # Check if any members are using this package; EXISTS stops at the first
+    # match, and the full count is only needed for the error message
+    members_using_package = MemberProfile.query.filter_by(current_package_id=package_id)
     
-    if members_count > 0:
+    if db.session.query(members_using_package.exists()).scalar():
+        members_count = members_using_package.count()
         return jsonify({
             'error': f'Cannot delete package with {members_count} active member(s). Please reassign members first.'
         }), 409
@@ -281,25 +308,33 @@ def purchase_package():
     if not package.is_active:
         return jsonify({'error': 'Package is not available'}), 400
     
-    # Get member profile
-    member = MemberProfile.query.filter_by(user_id=user_id).first()
-    if not member:
-        return jsonify({'error': 'Member profile not found'}), 404
-    
     try:
-        # Update member package
-        member.current_package_id = package_id
-        member.package_start_date = datetime.utcnow()
-        member.package_expiry_date = member.package_start_date + timedelta(days=package.duration_days)
+        # Update member package with one UPDATE ... RETURNING
+        package_start_date = datetime.utcnow()
+        row = db.session.execute(
+            update(MemberProfile)
+            .where(MemberProfile.user_id == user_id)
+            .values(
+                current_package_id=package_id,
+                package_start_date=package_start_date,
+                package_expiry_date=package_start_date + timedelta(days=package.duration_days)
+            )
+            .returning(MemberProfile.package_start_date, MemberProfile.package_expiry_date)
+        ).first()
+        
+        if row is None:
+            db.session.rollback()
+            return jsonify({'error': 'Member profile not found'}), 404
         
+        package_name = package.name
         db.session.commit()
         
         return jsonify({
             'message': 'Package purchased successfully',
             'package_id': package_id,
-            'package_name': package.name,
-            'package_start_date': member.package_start_date.isoformat(),
-            'package_expiry_date': member.package_expiry_date.isoformat()
+            'package_name': package_name,
+            'package_start_date': row.package_start_date.isoformat(),
+            'package_expiry_date': row.package_expiry_date.isoformat()
         }), 200
     except Exception as e:
         db.session.rollback()
@@ -327,7 +362,7 @@ def get_members_by_package():
     
     # Get user and verify they are trainer or admin
     user = User.query.get(user_id)
-    if not user or user.role not in [UserRole.TRAINER, UserRole.ADMIN]:
+    if not user or user.role not in _TRAINER_ADMIN:
         return jsonify({'error': 'Only trainers and admins can view this information'}), 401
     
     package_id = request.args.get('package_id')
@@ -335,20 +370,14 @@ def get_members_by_package():
     try:
         if package_id:
             # Get specific package with members
-            package = Package.query.get(package_id)
+            package = db.session.get(Package, package_id)
             if not package:
                 return jsonify({'error': 'Package not found'}), 404
             
-            members = MemberProfile.query.filter_by(current_package_id=package_id).all()
-            
-            # Include username for each member
-            members_data = []
-            for member in members:
-                member_dict = member.to_dict()
-                user_obj = User.query.get(member.user_id)
-                if user_obj:
-                    member_dict['username'] = user_obj.username
-                members_data.append(member_dict)
+            members = MemberProfile.query.options(
+                *_member_list_options()
+            ).filter_by(current_package_id=package_id).all()
+            members_data = [_member_with_username(member) for member in members]
             
             return jsonify({
                 'package': package.to_dict(),
@@ -359,19 +388,15 @@ def get_members_by_package():
             # Get all packages with their members
             packages = Package.query.order_by(Package.price.asc()).all()
             
+            # Every member (with username) in one query, grouped by package
+            # here rather than one member query per package
+            members_by_package = defaultdict(list)
+            for member in MemberProfile.query.options(*_member_list_options()):
+                members_by_package[member.current_package_id].append(_member_with_username(member))
+            
             result = []
             for package in packages:
-                members = MemberProfile.query.filter_by(current_package_id=package.id).all()
-                
-                # Include username for each member
-                members_data = []
-                for member in members:
-                    member_dict = member.to_dict()
-                    user_obj = User.query.get(member.user_id)
-                    if user_obj:
-                        member_dict['username'] = user_obj.username
-                    members_data.append(member_dict)
-                
+                members_data = members_by_package.get(package.id, [])
                 result.append({
                     'package': package.to_dict(),
                     'members': members_data,
@@ -379,15 +404,7 @@ def get_members_by_package():
                 })
             
             # Also include members with no package
-            no_package_members = MemberProfile.query.filter_by(current_package_id=None).all()
-            no_package_data = []
-            for member in no_package_members:
-                member_dict = member.to_dict()
-                user_obj = User.query.get(member.user_id)
-                if user_obj:
-                    member_dict['username'] = user_obj.username
-                no_package_data.append(member_dict)
-            
+            no_package_data = members_by_package.get(None, [])
             if no_package_data:
                 result.append({
                     'package': {'id': None, 'name': 'No Package', 'duration_days': 0, 'price': 0},
@@ -398,3 +415,24 @@ def get_members_by_package():
             return jsonify({'packages': result}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+
+
+def _member_list_options():
+    """
+    Loader options for member lists: the username comes from a join, and the
+    package and trainer selectin loads are skipped (MemberProfile.to_dict()
+    does not use them).
+    """
+    return (
+        joinedload(MemberProfile.user).load_only(User.username),
+        lazyload(MemberProfile.package),
+        lazyload(MemberProfile.trainer),
+    )
+
+
+def _member_with_username(member):
+    """Member dict plus the username of its (already loaded) user."""
+    member_dict = member.to_dict()
+    if member.user:
+        member_dict['username'] = member.user.username
+    return member_dict
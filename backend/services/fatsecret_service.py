@@ -2,11 +2,65 @@
 import requests
 import os
 import time
-import hashlib
 import hmac
 import base64
+import copy
+import re
 from urllib.parse import quote, urlencode
 import secrets
+import threading
+from requests.adapters import HTTPAdapter
+
+# Shared by all FatSecretService instances so keep-alive connections (and
+# their TLS sessions) outlive a single request
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Search results describe nutrition as text, e.g.
+# "Per 100g - Calories: 52kcal | Fat: 0.17g | Carbs: 13.81g | Protein: 0.26g"
+_DESCRIPTION_NUTRIENT_RE = re.compile(r'\b(Calories|Fat|Carbs|Protein):\s*(\d+(?:\.\d+)?)')
+_DESCRIPTION_NUTRIENTS = {
+    'Calories': 'calories',
+    'Fat': 'fat',
+    'Carbs': 'carbohydrate',
+    'Protein': 'protein'
+}
+
+# Process-wide cache of API results; food data rarely changes
+CACHE_TTL_SECONDS = 3600
+CACHE_MAX_ENTRIES = 1024
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(key, fetch, should_store=None):
+    """
+    Return the cached result for ``key``, calling ``fetch()`` on a miss.
+
+    Callers get their own deep copy, so changing a result never alters what
+    later callers see. ``fetch()`` raising stores nothing; results for which
+    ``should_store(result)`` is false are returned but not stored either.
+    When the cache is full, the entry that was stored first is dropped.
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry is not None and now < entry[0]:
+        return copy.deepcopy(entry[1])
+
+    result = fetch()
+    if should_store is None or should_store(result):
+        with _cache_lock:
+            _cache.pop(key, None)
+            while len(_cache) >= CACHE_MAX_ENTRIES:
+                del _cache[next(iter(_cache))]
+            _cache[key] = (now + CACHE_TTL_SECONDS, copy.deepcopy(result))
+    return result
+
 
 class FatSecretService:
     """Service for interacting with FatSecret Platform API using OAuth 1.0."""
@@ -16,27 +70,36 @@ class FatSecretService:
     def __init__(self):
         self.consumer_key = os.getenv('FATSECRET_CLIENT_ID')
         self.consumer_secret = os.getenv('FATSECRET_CLIENT_SECRET')
+        # The signing key only depends on the secret (no token secret in 2-legged OAuth)
+        self._signing_key = (
+            f"{quote(self.consumer_secret, safe='')}&".encode() if self.consumer_secret else None
+        )
+        # OAuth parameters that never change, with their encoded 'key=value' pairs
+        self._static_params = {
+            'oauth_consumer_key': self.consumer_key,
+            'oauth_signature_method': 'HMAC-SHA1',
+            'oauth_version': '1.0',
+            'format': 'json'
+        }
+        self._quoted_pairs = {
+            (k, v): f"{quote(str(k), safe='')}={quote(str(v), safe='')}"
+            for k, v in self._static_params.items()
+        }
     
     def _generate_oauth_signature(self, method, url, params):
         """Generate OAuth 1.0 signature."""
-        # Sort parameters
-        sorted_params = sorted(params.items())
-        
-        # Create parameter string
-        param_string = '&'.join([f"{quote(str(k), safe='')}={quote(str(v), safe='')}" for k, v in sorted_params])
+        # Create parameter string from the sorted parameters; the static
+        # OAuth pairs were encoded once in __init__
+        param_string = '&'.join(
+            self._quoted_pairs.get((k, v)) or f"{quote(str(k), safe='')}={quote(str(v), safe='')}"
+            for k, v in sorted(params.items())
+        )
         
         # Create signature base string
         signature_base = f"{method.upper()}&{quote(url, safe='')}&{quote(param_string, safe='')}"
         
-        # Create signing key
-        signing_key = f"{quote(self.consumer_secret, safe='')}&"
-        
-        # Generate signature
-        signature = hmac.new(
-            signing_key.encode(),
-            signature_base.encode(),
-            hashlib.sha1
-        ).digest()
+        # Generate signature (one-shot HMAC, no hmac object per call)
+        signature = hmac.digest(self._signing_key, signature_base.encode(), 'sha1')
         
         return base64.b64encode(signature).decode()
     
@@ -44,12 +107,9 @@ class FatSecretService:
         """Make authenticated request to FatSecret API."""
         # Add OAuth parameters
         oauth_params = {
-            'oauth_consumer_key': self.consumer_key,
-            'oauth_signature_method': 'HMAC-SHA1',
+            **self._static_params,
             'oauth_timestamp': str(int(time.time())),
-            'oauth_nonce': secrets.token_hex(16),
-            'oauth_version': '1.0',
-            'format': 'json'
+            'oauth_nonce': secrets.token_hex(16)
         }
         
         # Combine with request parameters
@@ -60,12 +120,16 @@ class FatSecretService:
         all_params['oauth_signature'] = signature
         
         # Make request
-        response = requests.get(self.BASE_URL, params=all_params)
+        response = _session.get(self.BASE_URL, params=all_params, timeout=REQUEST_TIMEOUT)
         
-        if response.status_code == 200:
-            return response.json()
-        else:
+        if response.status_code != 200:
             raise Exception(f"API request failed: {response.text}")
+        
+        # API errors (bad signature, rate limit, ...) come back as 200 with an 'error' object
+        data = response.json()
+        if isinstance(data, dict) and 'error' in data:
+            raise Exception(f"API request failed: {data['error']}")
+        return data
     
     def search_food(self, query, max_results=20):
         """
@@ -76,8 +140,16 @@ class FatSecretService:
             max_results: Maximum number of results
             
         Returns:
-            List of food items with nutrition info
+            List of food items with nutrition info (cached for an hour unless
+            empty; the list is the caller's own copy)
         """
+        return _cached(
+            ('search', query, max_results),
+            lambda: self._search_food(query, max_results),
+            should_store=bool
+        )
+    
+    def _search_food(self, query, max_results):
         params = {
             'method': 'foods.search',
             'search_expression': query,
@@ -102,14 +174,15 @@ class FatSecretService:
             food_id: FatSecret food ID
             
         Returns:
-            Detailed food information
+            Detailed food information (cached for an hour; the dict is the
+            caller's own copy)
         """
         params = {
             'method': 'food.get.v2',
             'food_id': food_id
         }
         
-        return self._make_request(params)
+        return _cached(('food', str(food_id)), lambda: self._make_request(params))
     
     def search_by_barcode(self, barcode):
         """
@@ -119,14 +192,15 @@ class FatSecretService:
             barcode: Product barcode
             
         Returns:
-            Food information
+            Food information, as returned by get_food_details()
         """
         params = {
             'method': 'food.find_id_for_barcode',
             'barcode': barcode
         }
         
-        data = self._make_request(params)
+        # The barcode's food_id is cached too, so a repeat scan skips both calls
+        data = _cached(('barcode', barcode), lambda: self._make_request(params))
         
         if 'food_id' in data and 'food_id' in data['food_id']:
             food_id = data['food_id']['value']
@@ -177,22 +251,11 @@ class FatSecretService:
                 'sodium': 0
             }
             
-            # Try to parse nutrition from description
-            try:
-                if 'Calories:' in desc:
-                    cal_part = desc.split('Calories:')[1].split('|')[0].strip()
-                    default_serving['calories'] = float(cal_part.replace('kcal', '').strip())
-                if 'Protein:' in desc:
-                    prot_part = desc.split('Protein:')[1].split('|')[0].strip() if '|' in desc.split('Protein:')[1] else desc.split('Protein:')[1].strip()
-                    default_serving['protein'] = float(prot_part.replace('g', '').strip())
-                if 'Carbs:' in desc:
-                    carb_part = desc.split('Carbs:')[1].split('|')[0].strip()
-                    default_serving['carbohydrate'] = float(carb_part.replace('g', '').strip())
-                if 'Fat:' in desc:
-                    fat_part = desc.split('Fat:')[1].split('|')[0].strip()
-                    default_serving['fat'] = float(fat_part.replace('g', '').strip())
-            except:
-                pass
+            # Parse nutrition from description in one pass; the first value for each label wins
+            for label, value in _DESCRIPTION_NUTRIENT_RE.findall(desc):
+                key = _DESCRIPTION_NUTRIENTS[label]
+                if not default_serving[key]:
+                    default_serving[key] = float(value)
         
         return {
             'food_id': food.get('food_id'),
@@ -1,6 +1,18 @@
 """Password hashing service using bcrypt."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
-from typing import Tuple
+from flask import current_app, has_app_context
+from typing import List, Sequence, Tuple, Union
+
+
+def _utf8(password: Union[str, bytes]) -> bytes:
+    return password if isinstance(password, bytes) else password.encode('utf-8')
+
+
+def _hash(password: Union[str, bytes], rounds: int) -> str:
+    return bcrypt.hashpw(_utf8(password), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
 
 
 class PasswordService:
@@ -9,21 +21,68 @@ class PasswordService:
     # Minimum 12 rounds as specified in requirements
     BCRYPT_ROUNDS = 12
     
-    @staticmethod
-    def hash_password(password: str) -> str:
+    # Machine-generated passwords (random tokens, >=122 bits of entropy) cannot be
+    # guessed, so the work factor buys nothing; 4 rounds keeps hashing ~ms-cheap
+    GENERATED_PASSWORD_ROUNDS = 4
+    
+    @classmethod
+    def hash_password(cls, password: Union[str, bytes]) -> str:
         """
         Hash a plaintext password using bcrypt.
         
+        The app's BCRYPT_ROUNDS setting overrides the work factor; only
+        TestingConfig sets it, so real deployments always use 12 rounds.
+        
         Args:
-            password: Plaintext password to hash
+            password: Plaintext password to hash (str, or already UTF-8 encoded bytes)
             
         Returns:
             Bcrypt password hash string
         """
         # Generate salt and hash password with minimum 12 rounds
-        salt = bcrypt.gensalt(rounds=PasswordService.BCRYPT_ROUNDS)
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return password_hash.decode('utf-8')
+        return _hash(password, cls._rounds())
+    
+    @classmethod
+    def hash_passwords(cls, passwords: Sequence[Union[str, bytes]]) -> List[str]:
+        """
+        Hash many plaintext passwords in parallel (bulk user imports, seeding).
+        
+        bcrypt releases the GIL while hashing, so a thread per core scales
+        close to linearly. Each password still gets its own salt.
+        
+        Args:
+            passwords: Plaintext passwords to hash
+            
+        Returns:
+            Bcrypt password hash strings, in the same order as ``passwords``
+        """
+        # Resolve the work factor here; worker threads have no app context
+        rounds = cls._rounds()
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(lambda password: _hash(password, rounds), passwords))
+    
+    @classmethod
+    def _rounds(cls) -> int:
+        if has_app_context():
+            return current_app.config.get('BCRYPT_ROUNDS', cls.BCRYPT_ROUNDS)
+        return cls.BCRYPT_ROUNDS
+    
+    @staticmethod
+    def hash_generated_password(password: str) -> str:
+        """
+        Hash a random, system-generated password with a low bcrypt cost.
+        
+        Only for high-entropy secrets that no person chose (e.g. the placeholder
+        password of an auto-created account). Use hash_password() for anything
+        a user types.
+        
+        Args:
+            password: Randomly generated plaintext password
+            
+        Returns:
+            Bcrypt password hash string
+        """
+        return _hash(password, PasswordService.GENERATED_PASSWORD_ROUNDS)
     
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
@@ -4,9 +4,10 @@ from app import db
 from models.user import User, UserRole
 from models.member_profile import MemberProfile
 from models.package import Package
+from models.transaction import Transaction, TransactionStatus, TransactionType
 from services.password_service import PasswordService
 from services.auth_service import AuthService
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 
 class TestMemberCRUDEndpoints:
@@ -296,6 +297,16 @@ class TestMemberCRUDEndpoints:
         assert data['page'] == 1
         assert data['per_page'] == 2
     
+    @pytest.mark.parametrize('per_page', [0, -1])
+    def test_list_members_rejects_non_positive_per_page(self, client, admin_token, per_page):
+        """Test that per_page below 1 is a 400, not a server error."""
+        response = client.get(f'/api/admin/members?per_page={per_page}',
+            headers={'Authorization': f'Bearer {admin_token}'}
+        )
+        
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'Invalid pagination parameters'
+    
     def test_get_member_success(self, client, admin_token, app):
         """Test getting member details."""
         # Create member
@@ -376,6 +387,60 @@ class TestMemberCRUDEndpoints:
         assert data['email'] == 'newemail@example.com'
         assert data['cnic'] == '12345-1234567-1'  # Unchanged
     
+    def _create_plain_member(self, client, admin_token):
+        response = client.post('/api/admin/members',
+            headers={'Authorization': f'Bearer {admin_token}'},
+            json={'full_name': 'Test Member', 'phone': '1234567890'}
+        )
+        assert response.status_code == 201
+        return response.get_json()['id']
+    
+    def test_update_member_accepts_unpadded_date(self, client, admin_token, app):
+        """Test that dates without zero padding are still accepted."""
+        member_id = self._create_plain_member(client, admin_token)
+        
+        response = client.put(f'/api/admin/members/{member_id}',
+            headers={'Authorization': f'Bearer {admin_token}'},
+            json={'date_of_birth': '2024-1-5'}
+        )
+        
+        assert response.status_code == 200
+        with app.app_context():
+            assert db.session.get(MemberProfile, member_id).date_of_birth == date(2024, 1, 5)
+    
+    @pytest.mark.parametrize('value', ['not-a-date', '2024-01-05T00:00:00+05:00'])
+    def test_update_member_rejects_invalid_date(self, client, admin_token, app, value):
+        """Test that an unparseable date is a 400 and changes nothing."""
+        member_id = self._create_plain_member(client, admin_token)
+        
+        response = client.put(f'/api/admin/members/{member_id}',
+            headers={'Authorization': f'Bearer {admin_token}'},
+            json={'phone': '9876543210', 'date_of_birth': value}
+        )
+        
+        assert response.status_code == 400
+        assert 'date_of_birth' in response.get_json()['error']
+        with app.app_context():
+            member = db.session.get(MemberProfile, member_id)
+            assert member.phone == '1234567890'
+            assert member.date_of_birth is None
+    
+    def test_create_member_rejects_invalid_date(self, client, admin_token):
+        """Test that a bad admission date is a 400 instead of defaulting to today."""
+        response = client.post('/api/admin/members',
+            headers={'Authorization': f'Bearer {admin_token}'},
+            json={
+                'full_name': 'Test Member',
+                'phone': '1234567890',
+                'cnic': '12345-1234567-1',
+                'email': 'member@example.com',
+                'admission_date': '05/01/2024'
+            }
+        )
+        
+        assert response.status_code == 400
+        assert 'admission_date' in response.get_json()['error']
+    
     def test_update_member_with_package(self, client, admin_token, app, test_package):
         """Test updating member with package assignment."""
         # Create member
@@ -460,6 +525,43 @@ class TestMemberCRUDEndpoints:
         data = response.get_json()
         assert 'Member not found' in data['error']
 
+    def test_delete_member_removes_user_and_transactions(self, client, admin_token, app):
+        """Test that deleting a member also removes its user and transactions."""
+        with app.app_context():
+            user = User(
+                username="member1",
+                password_hash=PasswordService.hash_password("password123"),
+                role=UserRole.MEMBER,
+                is_active=True
+            )
+            db.session.add(user)
+            db.session.flush()
+
+            member = MemberProfile(user_id=user.id, full_name='Member One', phone='1234567890')
+            db.session.add(member)
+            db.session.flush()
+
+            db.session.add(Transaction(
+                member_id=member.id,
+                amount=50.00,
+                transaction_type=TransactionType.ADMISSION,
+                status=TransactionStatus.COMPLETED
+            ))
+            db.session.commit()
+            member_id = member.id
+            user_id = user.id
+
+        response = client.delete(f'/api/admin/members/{member_id}',
+            headers={'Authorization': f'Bearer {admin_token}'}
+        )
+
+        assert response.status_code == 200
+        with app.app_context():
+            db.session.expire_all()
+            assert db.session.get(MemberProfile, member_id) is None
+            assert db.session.get(User, user_id) is None
+            assert Transaction.query.filter_by(member_id=member_id).count() == 0
+
 
 class TestMemberSearchEndpoints:
     """Tests for member search endpoints."""
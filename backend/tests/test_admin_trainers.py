@@ -187,7 +187,39 @@ class TestTrainerCRUDEndpoints:
         assert data['total'] == 5
         assert data['page'] == 1
         assert data['per_page'] == 2
-    
+
+    def test_list_trainers_with_cursor(self, client, admin_token, app):
+        """Test walking the trainer list with next_cursor."""
+        with app.app_context():
+            for i in range(5):
+                user = User(
+                    username=f"trainer{i}",
+                    password_hash="x",
+                    role=UserRole.TRAINER,
+                    is_active=True
+                )
+                db.session.add(user)
+                db.session.flush()
+                db.session.add(TrainerProfile(
+                    user_id=user.id,
+                    specialization=f'Specialization {i}',
+                    salary_rate=50.00 + i
+                ))
+            db.session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            url = '/api/admin/trainers?per_page=2' + (f'&cursor={cursor}' if cursor else '')
+            data = client.get(url, headers={'Authorization': f'Bearer {admin_token}'}).get_json()
+            seen.extend(trainer['id'] for trainer in data['trainers'])
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+
+        assert len(seen) == 5
+        assert seen == sorted(seen)
+
     def test_get_trainer_success(self, client, admin_token, app):
         """Test getting trainer details."""
         # Create trainer
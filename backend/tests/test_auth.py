@@ -44,8 +44,9 @@ class TestPasswordService:
         
         assert PasswordService.verify_password("", password_hash) is False
     
-    def test_hash_password_uses_minimum_rounds(self):
-        """Test that password hashing uses minimum 12 rounds."""
+    def test_hash_password_uses_minimum_rounds(self, app, monkeypatch):
+        """Test that password hashing uses minimum 12 rounds outside TestingConfig."""
+        monkeypatch.delitem(app.config, 'BCRYPT_ROUNDS')
         password = "test_password"
         password_hash = PasswordService.hash_password(password)
         
@@ -54,6 +55,38 @@ class TestPasswordService:
         rounds = int(password_hash.split('$')[2])
         assert rounds >= 12
 
+    def test_hash_password_uses_configured_rounds(self, app):
+        """Test that TestingConfig's lower work factor is applied and still verifies."""
+        password_hash = PasswordService.hash_password("test_password")
+        
+        assert int(password_hash.split('$')[2]) == app.config['BCRYPT_ROUNDS'] == 4
+        assert PasswordService.verify_password("test_password", password_hash)
+
+    def test_hash_password_accepts_bytes(self):
+        """Test that an already UTF-8 encoded password hashes the same as its str."""
+        password_hash = PasswordService.hash_password("pässword".encode('utf-8'))
+        
+        assert PasswordService.verify_password("pässword", password_hash)
+
+    def test_hash_passwords_keeps_order(self):
+        """Test that bulk hashing returns one salted hash per password, in order."""
+        passwords = [f"password{i}" for i in range(5)] + ["password0"]
+        hashes = PasswordService.hash_passwords(passwords)
+        
+        assert len(hashes) == len(passwords)
+        assert hashes[0] != hashes[5]
+        assert all(int(h.split('$')[2]) == 4 for h in hashes)
+        assert all(PasswordService.verify_password(p, h) for p, h in zip(passwords, hashes))
+
+    def test_hash_generated_password_verifies(self):
+        """Test that low-cost hashes of generated passwords still verify normally."""
+        password = "0f8b1c2e-7a4d-4e9b-9c3f-5d6e7f8a9b0c"
+        password_hash = PasswordService.hash_generated_password(password)
+
+        assert int(password_hash.split('$')[2]) == PasswordService.GENERATED_PASSWORD_ROUNDS
+        assert PasswordService.verify_password(password, password_hash) is True
+        assert PasswordService.verify_password("wrong", password_hash) is False
+
 
 class TestAuthService:
     """Tests for JWT token generation and validation."""
@@ -0,0 +1,25 @@
+"""Tests for CORS preflight (OPTIONS) handling."""
+import pytest
+
+PREFLIGHT_HEADERS = {
+    'Origin': 'http://localhost:5173',
+    'Access-Control-Request-Method': 'GET',
+    'Access-Control-Request-Headers': 'Authorization',
+}
+
+
+@pytest.mark.parametrize('path', ['/api/admin/members', '/api/packages/', '/api/auth/login'])
+def test_preflight_to_api_route_allowed_without_auth(client, path):
+    """Preflight to an API route is answered without a token and carries CORS headers."""
+    response = client.options(path, headers=PREFLIGHT_HEADERS)
+
+    assert response.status_code == 200
+    assert response.headers['Access-Control-Allow-Origin'] == 'http://localhost:5173'
+
+
+@pytest.mark.parametrize('path', ['/api/does-not-exist', '/dashboard'])
+def test_preflight_to_unserved_path_not_answered(client, path):
+    """Preflight to a path no API route serves is not an empty 200."""
+    response = client.options(path, headers=PREFLIGHT_HEADERS)
+
+    assert response.status_code == 405
@@ -0,0 +1,50 @@
+"""Tests for the email service."""
+from flask_mail import Message
+
+from app import mail
+from services.email_service import EmailService
+
+
+def test_reset_email_fills_templates(app, monkeypatch):
+    """Both bodies carry the link; the HTML body escapes the username."""
+    monkeypatch.setenv('MAIL_DEFAULT_SENDER', 'gym@example.com')
+    monkeypatch.setenv('FRONTEND_URL', 'https://gym.example.com')
+
+    with mail.record_messages() as outbox:
+        assert EmailService.send_password_reset_email('admin@example.com', '<admin>', 'tok123')
+
+    message = outbox[0]
+    link = 'https://gym.example.com/reset-password?token=tok123'
+    assert message.recipients == ['admin@example.com']
+    assert 'Hi <admin>,' in message.body and link in message.body
+    assert '<strong>&lt;admin&gt;</strong>' in message.html
+    assert f'href="{link}"' in message.html
+    assert '$' not in message.html
+
+
+def test_send_many_uses_one_connection(app, monkeypatch):
+    """A batch opens one connection and reports how many messages went out."""
+    connects = []
+    original_connect = mail.connect
+    monkeypatch.setattr(mail, 'connect', lambda: connects.append(1) or original_connect())
+    messages = [
+        Message('Hi', sender='gym@example.com', recipients=[f'member{i}@example.com'])
+        for i in range(3)
+    ]
+
+    with mail.record_messages() as outbox:
+        assert EmailService.send_many(messages) == 3
+
+    assert len(connects) == 1
+    assert [m.recipients for m in outbox] == [[f'member{i}@example.com'] for i in range(3)]
+
+
+def test_send_many_stops_after_a_third_fail(app):
+    """Once over a third of the batch has failed the rest is not attempted."""
+    messages = [Message('Hi', sender='gym@example.com', recipients=[f'm{i}@example.com']) for i in range(6)]
+    for msg in messages[:3]:
+        msg.recipients = []
+
+    with mail.record_messages() as outbox:
+        assert EmailService.send_many(messages) == 0
+    assert outbox == []
@@ -0,0 +1,64 @@
+"""Tests for the FatSecret lookup cache."""
+import pytest
+
+import services.fatsecret_service as fatsecret
+from services.fatsecret_service import FatSecretService
+
+
+class _FakeResponse:
+    status_code = 200
+    text = ''
+
+    def __init__(self, body):
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """A FatSecretService whose HTTP calls return queued bodies; counts calls."""
+    monkeypatch.setenv('FATSECRET_CLIENT_ID', 'key')
+    monkeypatch.setenv('FATSECRET_CLIENT_SECRET', 'secret')
+    monkeypatch.setattr(fatsecret, '_cache', {})
+    bodies = []
+    calls = []
+
+    def fake_get(*args, **kwargs):
+        calls.append(kwargs['params'])
+        return _FakeResponse(bodies.pop(0))
+
+    monkeypatch.setattr(fatsecret._session, 'get', fake_get)
+    return FatSecretService(), bodies, calls
+
+
+def test_error_body_raises_and_is_not_cached(service):
+    """A 200 carrying an 'error' object raises, and the next call asks again."""
+    fatsecret_service, bodies, calls = service
+    bodies += [{'error': {'code': 12, 'message': 'limit exceeded'}}, {'food': {'food_id': '1'}}]
+
+    with pytest.raises(Exception, match='limit exceeded'):
+        fatsecret_service.get_food_details('1')
+    assert fatsecret_service.get_food_details('1') == {'food': {'food_id': '1'}}
+    assert len(calls) == 2
+
+
+def test_empty_search_not_cached(service):
+    """Searches with no results are retried instead of served from the cache."""
+    fatsecret_service, bodies, calls = service
+    bodies += [{'foods': {'total_results': '0'}}, {'foods': {'food': {'food_id': '1'}}}]
+
+    assert fatsecret_service.search_food('egg') == []
+    assert fatsecret_service.search_food('egg') == [{'food_id': '1'}]
+    assert len(calls) == 2
+
+
+def test_cached_results_are_copies(service):
+    """Changing a returned result does not change what the cache serves next."""
+    fatsecret_service, bodies, calls = service
+    bodies.append({'foods': {'food': [{'food_id': '1'}]}})
+
+    fatsecret_service.search_food('egg').append({'food_id': '2'})
+    assert fatsecret_service.search_food('egg') == [{'food_id': '1'}]
+    assert len(calls) == 1
@@ -0,0 +1,25 @@
+"""Tests for the datetime formatting helpers."""
+from datetime import datetime
+
+import pytest
+
+from utils.formatters import format_utc_iso, parse_utc_iso
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2026-02-16T09:30:00Z', datetime(2026, 2, 16, 9, 30)),
+    ('2026-02-16T09:30:00', datetime(2026, 2, 16, 9, 30)),
+    ('2026-02-16T14:30:00+05:00', datetime(2026, 2, 16, 9, 30)),
+    ('2026-02-16', datetime(2026, 2, 16)),
+    ('not a date', None),
+    ('', None),
+    (None, None),
+    (20260216, None),
+])
+def test_parse_utc_iso(value, expected):
+    assert parse_utc_iso(value) == expected
+
+
+def test_parse_utc_iso_round_trips_format_utc_iso():
+    dt = datetime(2026, 2, 16, 9, 30, 15, 250000)
+    assert parse_utc_iso(format_utc_iso(dt)) == dt
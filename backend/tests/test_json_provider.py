@@ -0,0 +1,56 @@
+"""Tests for the orjson-backed JSON provider."""
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+from utils.formatters import format_utc_iso
+from utils.json_provider import ORJSONProvider, utc_json_response
+
+
+class TestORJSONProvider:
+    """The provider must produce the same JSON as Flask's default provider."""
+
+    def test_app_uses_orjson_provider(self, app):
+        """create_app installs the orjson provider."""
+        assert isinstance(app.json, ORJSONProvider)
+
+    def test_matches_default_provider_output(self, app):
+        """Decimals, UUIDs, dates and datetimes serialize like the default provider."""
+        payload = {
+            'amount': Decimal('49.99'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'due': date(2026, 2, 16),
+            'paid_at': datetime(2026, 2, 16, 9, 30),
+            'nested': [{'name': 'Basic', 'price': 50.0}],
+        }
+        expected = json.loads(DefaultJSONProvider(app).dumps(payload))
+
+        assert json.loads(app.json.dumps(payload)) == expected
+
+    def test_non_string_keys(self, app):
+        """Integer keys (e.g. hour buckets) are serialized as strings."""
+        assert json.loads(app.json.dumps({9: 3, 18: 7})) == {'9': 3, '18': 7}
+
+    def test_jsonify_response(self, app):
+        """jsonify responses are encoded by orjson and parse back."""
+        with app.test_request_context():
+            from flask import jsonify
+            response = jsonify({'status': 'ok', 'total': Decimal('10.50')})
+
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'status': 'ok', 'total': '10.50'}
+
+    def test_utc_json_response_matches_format_utc_iso(self, app):
+        """Naive datetimes come out exactly as format_utc_iso() renders them."""
+        moments = [datetime(2026, 2, 16, 9, 30), datetime(2026, 2, 16, 9, 30, 0, 123456)]
+        with app.test_request_context():
+            response = utc_json_response({'at': moments, 'none': None, 'amount': Decimal('1.50')})
+
+        assert response.get_json() == {
+            'at': [format_utc_iso(moment) for moment in moments],
+            'none': None,
+            'amount': '1.50',
+        }
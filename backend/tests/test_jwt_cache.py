@@ -0,0 +1,115 @@
+"""Tests for the verified-claims JWT cache used by the RBAC decorators."""
+import pytest
+from flask import jsonify
+from flask_jwt_extended import get_jwt_identity
+
+import middleware.jwt_cache as jwt_cache
+from middleware.rbac import require_admin, require_role
+from services.auth_service import AuthService
+
+
+@pytest.fixture
+def protected_client(app, monkeypatch):
+    """Client for an app with admin- and trainer-only test routes; counts real verifications."""
+    calls = []
+    real_verify = jwt_cache.verify_jwt_in_request
+
+    def counting_verify(*args, **kwargs):
+        calls.append(1)
+        return real_verify(*args, **kwargs)
+
+    monkeypatch.setattr(jwt_cache, 'verify_jwt_in_request', counting_verify)
+    jwt_cache.clear_cache()
+
+    @app.route('/test/admin-only')
+    @require_admin
+    def admin_only():
+        return jsonify({'identity': get_jwt_identity()})
+
+    @app.route('/test/trainer-only')
+    @require_role('trainer')
+    def trainer_only():
+        return jsonify({'identity': get_jwt_identity()})
+
+    yield app.test_client(), calls
+    jwt_cache.clear_cache()
+
+
+def _auth(app, user_id, role):
+    with app.app_context():
+        token = AuthService.generate_token(user_id, 'someone', role)
+    return {'Authorization': f'Bearer {token}'}
+
+
+class TestJwtCache:
+    """Tests for cached_verify through require_admin/require_role."""
+
+    def test_repeat_requests_reuse_verified_claims(self, app, protected_client):
+        """Second request with the same token skips full verification."""
+        client, calls = protected_client
+        headers = _auth(app, 'admin-1', 'admin')
+
+        first = client.get('/test/admin-only', headers=headers)
+        second = client.get('/test/admin-only', headers=headers)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        # Identity is still available to the view on a cache hit
+        assert second.get_json()['identity'] == 'admin-1'
+        assert len(calls) == 1
+
+    def test_expired_entry_is_verified_again(self, app, protected_client, monkeypatch):
+        """Entries older than the TTL fall back to full verification."""
+        client, calls = protected_client
+        monkeypatch.setattr(jwt_cache, 'CACHE_TTL_SECONDS', 0)
+        headers = _auth(app, 'admin-1', 'admin')
+
+        client.get('/test/admin-only', headers=headers)
+        client.get('/test/admin-only', headers=headers)
+
+        assert len(calls) == 2
+
+    def test_cached_claims_still_enforce_role(self, app, protected_client):
+        """A cached non-admin token is still rejected by require_admin."""
+        client, calls = protected_client
+        headers = _auth(app, 'trainer-1', 'trainer')
+
+        assert client.get('/test/trainer-only', headers=headers).status_code == 200
+        assert client.get('/test/admin-only', headers=headers).status_code == 403
+        assert len(calls) == 1
+
+    def test_invalid_token_is_not_cached(self, protected_client):
+        """Tokens that fail verification are rejected every time."""
+        client, calls = protected_client
+        headers = {'Authorization': 'Bearer not-a-jwt'}
+
+        assert client.get('/test/admin-only', headers=headers).status_code == 401
+        assert client.get('/test/admin-only', headers=headers).status_code == 401
+        assert len(calls) == 2
+
+    def test_missing_token_rejected(self, protected_client):
+        """Requests without a token are rejected by require_admin."""
+        client, _ = protected_client
+
+        assert client.get('/test/admin-only').status_code == 401
+
+
+def test_change_password_decodes_token_once(app, client, monkeypatch):
+    """require_admin alone guards change-password; the token is decoded once."""
+    import flask_jwt_extended.view_decorators as view_decorators
+
+    decodes = []
+    real_decode = view_decorators.decode_token
+
+    def counting_decode(*args, **kwargs):
+        decodes.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(view_decorators, 'decode_token', counting_decode)
+    jwt_cache.clear_cache()
+
+    response = client.post('/api/admin/change-password', headers=_auth(app, 'admin-1', 'admin'), json={})
+
+    assert response.status_code == 400
+    assert len(decodes) == 1
+    jwt_cache.clear_cache()
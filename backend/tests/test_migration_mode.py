@@ -0,0 +1,33 @@
+"""Tests for the MIGRATION_MODE startup options."""
+import os
+import re
+
+from sqlalchemy import create_engine, text
+
+from app import create_app
+from config import TestingConfig
+
+ALEMBIC_VERSIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'alembic', 'versions')
+
+
+def _head_revision():
+    """Revision id of the newest migration (files are numbered in order)."""
+    latest = max(name for name in os.listdir(ALEMBIC_VERSIONS) if name[:3].isdigit())
+    with open(os.path.join(ALEMBIC_VERSIONS, latest)) as f:
+        return re.search(r"^revision = '([^']+)'", f.read(), re.MULTILINE).group(1)
+
+
+def test_async_mode_upgrades_to_head(tmp_path):
+    """MIGRATION_MODE=async runs `alembic upgrade head` against the app's database."""
+    database_url = f"sqlite:///{tmp_path / 'gym.db'}"
+
+    class AsyncMigrationConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = database_url
+        MIGRATION_MODE = 'async'
+
+    app, _ = create_app(AsyncMigrationConfig)
+    app.extensions['migration_thread'].join(timeout=300)
+
+    with create_engine(database_url).connect() as connection:
+        version = connection.execute(text('SELECT version_num FROM alembic_version')).scalar()
+    assert version == _head_revision()
@@ -0,0 +1,303 @@
+"""Statement-count guards for admin list and dashboard endpoints (no N+1)."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from models.user import User, UserRole
+from models.member_profile import MemberProfile
+from models.trainer_profile import TrainerProfile
+from models.package import Package
+from models.transaction import Transaction, TransactionStatus, TransactionType
+from services.auth_service import AuthService
+
+MAX_STATEMENTS = 3
+
+
+@pytest.fixture
+def admin_headers(app):
+    """Seed trainers, members and transactions; return admin auth headers."""
+    admin = User(username='admin', password_hash='x', role=UserRole.ADMIN, is_active=True)
+    package = Package(name='Monthly', duration_days=30, price=100, is_active=True)
+    db.session.add_all([admin, package])
+    db.session.flush()
+
+    trainers = []
+    for i in range(3):
+        user = User(username=f'trainer{i}', password_hash='x', role=UserRole.TRAINER)
+        db.session.add(user)
+        db.session.flush()
+        trainer = TrainerProfile(user_id=user.id, specialization='Strength', salary_rate=10)
+        db.session.add(trainer)
+        trainers.append(trainer)
+    db.session.flush()
+
+    for i in range(10):
+        user = User(username=f'member{i}', password_hash='x', role=UserRole.MEMBER)
+        db.session.add(user)
+        db.session.flush()
+        member = MemberProfile(
+            user_id=user.id,
+            full_name=f'Member {i}',
+            trainer_id=trainers[i % 3].id,
+            current_package_id=package.id
+        )
+        db.session.add(member)
+        db.session.flush()
+        db.session.add(Transaction(
+            member_id=member.id,
+            amount=100,
+            transaction_type=TransactionType.PACKAGE,
+            status=TransactionStatus.PENDING,
+            due_date=datetime.utcnow() - timedelta(days=i)
+        ))
+    db.session.commit()
+    admin_id = admin.id
+    db.session.expunge_all()
+
+    token = AuthService.generate_token(admin_id, 'admin', 'admin')
+    return {'Authorization': f'Bearer {token}'}
+
+
+def _run_recording_statements(send):
+    """Call ``send()`` and return its response with every SQL statement it ran."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = send()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert response.status_code == 200
+    return response, statements
+
+
+def _count_statements(client, url, headers):
+    _, statements = _run_recording_statements(lambda: client.get(url, headers=headers))
+    return len(statements)
+
+
+@pytest.mark.parametrize('url', [
+    '/api/admin/trainers',
+    '/api/admin/finance/member-payments-fixed',
+    '/api/admin/dashboard/revenue-projection',
+    '/api/finance/reports',
+])
+def test_endpoint_statement_count_is_constant(client, admin_headers, url):
+    """Each endpoint runs a fixed handful of statements regardless of row count."""
+    assert _count_statements(client, url, admin_headers) <= MAX_STATEMENTS
+
+
+def test_list_trainers_without_count(client, admin_headers):
+    """count=false drops the COUNT query and the 'total' key."""
+    with_total = _count_statements(client, '/api/admin/trainers', admin_headers)
+    without_total = _count_statements(client, '/api/admin/trainers?count=false', admin_headers)
+    data = client.get('/api/admin/trainers?count=false', headers=admin_headers).get_json()
+
+    assert without_total == with_total - 1
+    assert 'total' not in data
+    assert data['has_next'] is False
+    assert len(data['trainers']) == 3
+
+
+@pytest.mark.parametrize('query', ['per_page=0', 'per_page=-1', 'per_page=-1&page=3'])
+def test_list_trainers_rejects_non_positive_per_page(client, admin_headers, query):
+    """per_page below 1 is a 400 instead of an empty-page crash or negative OFFSET."""
+    response = client.get(f'/api/admin/trainers?{query}', headers=admin_headers)
+    assert response.status_code == 400
+
+
+def test_list_members_next_pages_reuse_count(client, admin_headers):
+    """Only the first page counts members; page 2 and cursor pages reuse its total."""
+    first, first_statements = _run_recording_statements(
+        lambda: client.get('/api/admin/members?per_page=4', headers=admin_headers)
+    )
+    cursor = first.get_json()['next_cursor']
+    for url in ('/api/admin/members?per_page=4&page=2', f'/api/admin/members?per_page=4&cursor={cursor}'):
+        response, statements = _run_recording_statements(lambda: client.get(url, headers=admin_headers))
+        assert len(statements) == len(first_statements) - 1
+        assert response.get_json()['total'] == 10
+
+    assert first.get_json()['total'] == 10
+
+
+def test_mark_paid_batch_statement_count(client, admin_headers):
+    """Marking a batch paid loads and commits in a fixed number of statements."""
+    ids = [t.id for t in Transaction.query.all()]
+    response, statements = _run_recording_statements(lambda: client.post(
+        '/api/admin/finance/transactions/mark-paid-batch',
+        headers=admin_headers,
+        json={'ids': ids + ['missing']}
+    ))
+
+    data = response.get_json()
+    assert sorted(data['updated']) == sorted(ids)
+    assert data['not_found'] == ['missing']
+    # Select transactions+members, packages, trainers, then the writes
+    selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+    assert len(selects) <= MAX_STATEMENTS
+    assert Transaction.query.filter_by(status=TransactionStatus.PENDING).count() == len(ids)
+
+
+def test_mark_paid_batch_retry_is_idempotent(client, admin_headers):
+    """Resending the same ids reports them as already paid and adds no follow-ups."""
+    ids = [t.id for t in Transaction.query.all()]
+    url = '/api/admin/finance/transactions/mark-paid-batch'
+    first = client.post(url, headers=admin_headers, json={'ids': ids}).get_json()
+    pending_after_first = Transaction.query.filter_by(status=TransactionStatus.PENDING).count()
+
+    retry = client.post(url, headers=admin_headers, json={'ids': ids}).get_json()
+
+    assert sorted(first['updated']) == sorted(ids)
+    assert retry['updated'] == []
+    assert sorted(retry['already_paid']) == sorted(ids)
+    assert retry['not_found'] == []
+    assert Transaction.query.filter_by(status=TransactionStatus.PENDING).count() == pending_after_first
+
+
+def test_update_trainer_does_not_refetch_user(client, admin_headers):
+    """The trainer's user comes in with the trainer, also on the post-commit refresh."""
+    trainer_id = TrainerProfile.query.first().id
+    response, statements = _run_recording_statements(lambda: client.put(
+        f'/api/admin/trainers/{trainer_id}',
+        headers=admin_headers,
+        json={'specialization': 'Yoga'}
+    ))
+
+    assert response.get_json()['username'] == 'trainer0'
+    assert not [s for s in statements if s.lstrip().upper().startswith('SELECT') and 'FROM users' in s]
+    assert len(statements) <= MAX_STATEMENTS
+
+
+def test_list_trainers_sparse_fields(client, admin_headers):
+    """fields= limits both the SELECT and the returned keys (id always included)."""
+    response, statements = _run_recording_statements(lambda: client.get(
+        '/api/admin/trainers?count=false&fields=full_name,salary_rate',
+        headers=admin_headers
+    ))
+
+    trainers = response.get_json()['trainers']
+    assert len(trainers) == 3
+    assert all(set(t) == {'id', 'full_name', 'salary_rate'} for t in trainers)
+    assert all(isinstance(t['salary_rate'], float) for t in trainers)
+    select_sql = [s for s in statements if 'FROM trainer_profiles' in s][-1]
+    assert 'availability' not in select_sql
+    assert 'users' not in select_sql
+
+
+def test_members_by_package_does_not_grow_with_members(client, admin_headers):
+    """Members and their users are loaded in one query, not one per member."""
+    url = '/api/packages/members-by-package'
+    before = _count_statements(client, url, admin_headers)
+    assert before <= MAX_STATEMENTS
+
+    package_id = Package.query.first().id
+    for i in range(5):
+        user = User(username=f'extra{i}', password_hash='x', role=UserRole.MEMBER)
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(MemberProfile(user_id=user.id, full_name=f'Extra {i}', current_package_id=package_id))
+    db.session.commit()
+
+    assert _count_statements(client, url, admin_headers) == before
+    data = client.get(url, headers=admin_headers).get_json()
+    assert [p['count'] for p in data['packages']] == [15]
+    assert data['packages'][0]['members'][0]['username'] == 'member0'
+
+
+def test_financial_reports_cached_until_write(client, admin_headers):
+    """Repeat report loads skip the aggregate; marking a payment refreshes it."""
+    url = '/api/finance/reports'
+    first = client.get(url, headers=admin_headers).get_json()
+    response, statements = _run_recording_statements(lambda: client.get(url, headers=admin_headers))
+    assert response.get_json() == first
+    assert not [s for s in statements if 'FROM transactions' in s]
+
+    transaction_id = Transaction.query.first().id
+    client.post(f'/api/finance/transactions/{transaction_id}/mark-paid', headers=admin_headers, json={})
+    refreshed = client.get(url, headers=admin_headers).get_json()
+    assert refreshed['completed_transactions_count'] == first['completed_transactions_count'] + 1
+    assert refreshed['pending_transactions_count'] == first['pending_transactions_count'] - 1
+
+
+def test_update_settings_batches_package_updates(client, admin_headers):
+    """Packages are fetched in one query and all validated before any change."""
+    extra = Package(name='Quarterly', duration_days=90, price=250, is_active=True)
+    db.session.add(extra)
+    db.session.commit()
+    package_ids = [p.id for p in Package.query.all()]
+
+    response, statements = _run_recording_statements(lambda: client.put(
+        '/api/finance/settings',
+        headers=admin_headers,
+        json={'packages': [{'id': package_id, 'price': 120} for package_id in package_ids]}
+    ))
+    assert [p['price'] for p in response.get_json()['packages']] == [120.0, 120.0]
+    assert len([s for s in statements if 'FROM packages' in s]) == 1
+
+    invalid = client.put('/api/finance/settings', headers=admin_headers, json={'packages': [
+        {'id': package_ids[0], 'price': 80},
+        {'id': package_ids[1], 'price': -1},
+    ]})
+    assert invalid.status_code == 400
+    db.session.expire_all()
+    assert db.session.get(Package, package_ids[0]).price == 120
+
+
+def test_delete_package_checks_members_with_exists(client, admin_headers):
+    """The in-use check is an EXISTS probe; COUNT only runs for the 409 message."""
+    used = Package.query.first()
+    unused = Package(name='Unused', duration_days=30, price=10, is_active=True)
+    db.session.add(unused)
+    db.session.commit()
+    used_id, unused_id = used.id, unused.id
+
+    conflict = client.delete(f'/api/packages/{used_id}', headers=admin_headers)
+    assert conflict.status_code == 409
+    assert '10 active member(s)' in conflict.get_json()['error']
+
+    response, statements = _run_recording_statements(
+        lambda: client.delete(f'/api/packages/{unused_id}', headers=admin_headers)
+    )
+    assert any('EXISTS' in s for s in statements)
+    assert not any('count(' in s.lower() for s in statements)
+
+
+def test_mark_payment_received_is_one_update(client, admin_headers):
+    """The payment is marked with UPDATE ... RETURNING, without loading it first."""
+    transaction_id = Transaction.query.first().id
+    db.session.expunge_all()
+    response, statements = _run_recording_statements(lambda: client.post(
+        f'/api/finance/transactions/{transaction_id}/mark-paid',
+        headers=admin_headers,
+        json={'paid_date': '2024-05-01T10:00:00Z'}
+    ))
+
+    data = response.get_json()
+    assert data['status'] == 'COMPLETED'
+    assert data['paid_date'] == '2024-05-01T10:00:00'
+    assert not [s for s in statements if 'FROM transactions' in s]
+    assert [s for s in statements if s.lstrip().startswith('UPDATE transactions')]
+
+    missing = client.post('/api/finance/transactions/missing/mark-paid', headers=admin_headers, json={})
+    assert missing.status_code == 404
+
+
+def test_large_transaction_page_is_streamed(client, admin_headers, monkeypatch):
+    """Pages above the stream batch size come back as the same JSON, streamed."""
+    from routes import finance
+    url = '/api/finance/transactions?per_page=5'
+    buffered = client.get(url, headers=admin_headers).get_json()
+
+    monkeypatch.setattr(finance, 'TRANSACTIONS_STREAM_BATCH', 2)
+    streamed = client.get(url, headers=admin_headers, buffered=False)
+    assert streamed.is_streamed
+    assert streamed.get_json() == buffered
+    assert buffered['total'] == 10
+
+    page_two = client.get(url + '&page=2', headers=admin_headers).get_json()
+    assert len(page_two['transactions']) == 5
@@ -0,0 +1,188 @@
+"""Tests for the in-process dashboard response cache."""
+import pytest
+from flask import jsonify, request
+from sqlalchemy import event
+
+from app import db
+from models.package import Package
+from models.user import User, UserRole
+from services.auth_service import AuthService
+from utils import response_cache
+from utils.response_cache import cached_count, cached_json, invalidate
+
+
+@pytest.fixture
+def admin_headers(app):
+    """Auth headers for a freshly created admin user."""
+    admin = User(username='admin', password_hash='x', role=UserRole.ADMIN, is_active=True)
+    db.session.add(admin)
+    db.session.commit()
+    token = AuthService.generate_token(admin.id, 'admin', 'admin')
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.fixture
+def cached_client(app):
+    """Client for an app with cached routes and a write route outside the data blueprints."""
+    calls = []
+
+    @app.route('/test/cached')
+    @cached_json('test:counter')
+    def cached_counter():
+        calls.append(1)
+        return jsonify({'calls': len(calls)})
+
+    @app.route('/test/failing')
+    @cached_json('test:failing')
+    def failing():
+        calls.append(1)
+        return jsonify({'error': 'boom'}), 500
+
+    @app.route('/test/paged')
+    @cached_json('test:paged', vary_on=('page',))
+    def paged():
+        calls.append(1)
+        return jsonify({'page': request.args.get('page'), 'calls': len(calls)})
+
+    @app.route('/test/write', methods=['POST'])
+    def write():
+        return jsonify({'ok': True})
+
+    return app.test_client(), calls
+
+
+class TestResponseCache:
+    """Successful responses are reused until they expire or a write happens."""
+
+    def test_second_request_served_from_cache(self, cached_client):
+        client, calls = cached_client
+        assert client.get('/test/cached').get_json() == {'calls': 1}
+        assert client.get('/test/cached').get_json() == {'calls': 1}
+        assert len(calls) == 1
+
+    def test_errors_not_cached(self, cached_client):
+        client, calls = cached_client
+        assert client.get('/test/failing').status_code == 500
+        assert client.get('/test/failing').status_code == 500
+        assert len(calls) == 2
+
+    def test_write_request_invalidates(self, cached_client, admin_headers):
+        client, calls = cached_client
+        client.get('/test/cached')
+        client.put('/api/admin/settings', headers=admin_headers, json={'admission_fee': 100})
+
+        assert client.get('/test/cached').get_json() == {'calls': 2}
+
+    def test_write_outside_data_blueprints_keeps_cache(self, cached_client):
+        client, calls = cached_client
+        client.get('/test/cached')
+        client.post('/test/write')
+
+        assert client.get('/test/cached').get_json() == {'calls': 1}
+
+    def test_matching_etag_returns_304(self, cached_client):
+        client, calls = cached_client
+        first = client.get('/test/cached')
+        etag = first.headers['ETag']
+        assert 'no-cache' in first.headers['Cache-Control']
+
+        revalidated = client.get('/test/cached', headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        assert revalidated.data == b''
+        assert len(calls) == 1
+
+    def test_etag_changes_after_write(self, cached_client, admin_headers):
+        client, calls = cached_client
+        etag = client.get('/test/cached').headers['ETag']
+        client.put('/api/admin/settings', headers=admin_headers, json={'admission_fee': 100})
+
+        response = client.get('/test/cached', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_vary_on_caches_each_parameter_value(self, cached_client):
+        client, calls = cached_client
+        assert client.get('/test/paged?page=1').get_json() == {'page': '1', 'calls': 1}
+        assert client.get('/test/paged?page=2').get_json() == {'page': '2', 'calls': 2}
+        assert client.get('/test/paged?page=1').get_json() == {'page': '1', 'calls': 1}
+        assert len(calls) == 2
+
+    def test_unlisted_query_params_share_an_entry(self, cached_client):
+        client, calls = cached_client
+        assert client.get('/test/paged?page=1&_t=1').get_json() == {'page': '1', 'calls': 1}
+        assert client.get('/test/paged?_t=2&page=1').get_json() == {'page': '1', 'calls': 1}
+        assert len(calls) == 1
+
+    def test_full_cache_evicts_oldest_entry(self, app, cached_client, monkeypatch):
+        client, calls = cached_client
+        monkeypatch.setattr(response_cache, 'MAX_ENTRIES', 2)
+        client.get('/test/paged?page=1')
+        client.get('/test/paged?page=2')
+        client.get('/test/paged?page=3')
+        assert len(app.extensions['response_cache']) == 2
+        assert client.get('/test/paged?page=1').get_json() == {'page': '1', 'calls': 4}
+
+    def test_invalidate_by_prefix(self, app, cached_client):
+        client, calls = cached_client
+        client.get('/test/cached')
+        with app.app_context():
+            invalidate('other:')
+        assert client.get('/test/cached').get_json() == {'calls': 1}
+
+        with app.app_context():
+            invalidate('test:')
+        assert client.get('/test/cached').get_json() == {'calls': 2}
+
+
+def test_admin_settings_cached_until_updated(client, admin_headers):
+    """GET /settings skips the settings query once cached; PUT refreshes it."""
+    settings_selects = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if 'FROM settings' in statement:
+            settings_selects.append(statement)
+
+    assert client.get('/api/admin/settings', headers=admin_headers).get_json()['admission_fee'] == 5000
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        assert client.get('/api/admin/settings', headers=admin_headers).status_code == 200
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert settings_selects == []
+
+    client.put('/api/admin/settings', headers=admin_headers, json={'admission_fee': 3000})
+    assert client.get('/api/admin/settings', headers=admin_headers).get_json()['admission_fee'] == 3000
+
+
+def test_cached_count_reused_until_refresh(app, client, admin_headers):
+    """A stored count is returned as-is until refreshed or a write clears it."""
+    query = User.query.filter_by(role=UserRole.ADMIN)
+    assert cached_count('count:test', query) == 1
+
+    db.session.add(User(username='admin2', password_hash='x', role=UserRole.ADMIN))
+    db.session.commit()
+    assert cached_count('count:test', query) == 1
+    assert cached_count('count:test', query, refresh=True) == 2
+
+    db.session.add(User(username='admin3', password_hash='x', role=UserRole.ADMIN))
+    db.session.commit()
+    client.put('/api/admin/settings', headers=admin_headers, json={'admission_fee': 100})
+    assert cached_count('count:test', query) == 3
+
+
+def test_package_list_revalidates_until_package_changes(client, admin_headers):
+    """A matching ETag on the package list gets a 304 until a package is edited."""
+    package = Package(name='Monthly', duration_days=30, price=100, is_active=True)
+    db.session.add(package)
+    db.session.commit()
+    package_id = package.id
+
+    etag = client.get('/api/packages/', headers=admin_headers).headers['ETag']
+    conditional = {**admin_headers, 'If-None-Match': etag}
+    assert client.get('/api/packages/', headers=conditional).status_code == 304
+
+    client.put(f'/api/packages/{package_id}', headers=admin_headers, json={'price': 120})
+    response = client.get('/api/packages/', headers=conditional)
+    assert response.status_code == 200
+    assert response.get_json()['packages'][0]['price'] == 120
@@ -0,0 +1,47 @@
+"""Tests for the SQLALCHEMY_STRICT_LAZY development aid."""
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import joinedload
+
+from app import db
+from models.user import User, UserRole
+from models.member_profile import MemberProfile
+
+
+@pytest.fixture
+def member_id(app):
+    """Create a member with its user and return the profile id."""
+    user = User(username='member1', password_hash='x', role=UserRole.MEMBER, is_active=True)
+    db.session.add(user)
+    db.session.flush()
+    member = MemberProfile(user_id=user.id, full_name='Member One')
+    db.session.add(member)
+    db.session.commit()
+    member_id = member.id
+    db.session.expunge_all()
+    return member_id
+
+
+class TestStrictLazy:
+    """Lazy loads raise only when SQLALCHEMY_STRICT_LAZY is enabled."""
+
+    def test_lazy_load_allowed_by_default(self, app, member_id):
+        """Without the flag relationships lazy load as usual."""
+        member = db.session.scalars(db.select(MemberProfile).filter_by(id=member_id)).one()
+        assert member.user.username == 'member1'
+
+    def test_lazy_load_raises_when_strict(self, app, member_id):
+        """With the flag an unplanned lazy load raises instead of querying."""
+        app.config['SQLALCHEMY_STRICT_LAZY'] = True
+        member = db.session.scalars(db.select(MemberProfile).filter_by(id=member_id)).one()
+
+        with pytest.raises(InvalidRequestError):
+            member.user
+
+    def test_explicit_eager_load_allowed_when_strict(self, app, member_id):
+        """Relationships loaded with an explicit loader option still work."""
+        app.config['SQLALCHEMY_STRICT_LAZY'] = True
+        member = db.session.scalars(
+            db.select(MemberProfile).options(joinedload(MemberProfile.user)).filter_by(id=member_id)
+        ).one()
+        assert member.user.username == 'member1'
@@ -0,0 +1,23 @@
+"""Tests for the UUIDType id column type."""
+from sqlalchemy.dialects import postgresql, sqlite
+
+from database import UUIDType
+
+
+def _bind(dialect, value):
+    processor = UUIDType.dialect_impl(dialect).bind_processor(dialect)
+    return processor(value) if processor else value
+
+
+def test_postgresql_binds_non_uuid_as_nil():
+    """Ids that aren't UUIDs match no row instead of raising DataError."""
+    dialect = postgresql.dialect()
+    assert _bind(dialect, 'missing') == '00000000-0000-0000-0000-000000000000'
+    assert _bind(dialect, '0F8B1C2E-7A4D-4E9B-9C3F-5D6E7F8A9B0C') == '0f8b1c2e-7a4d-4e9b-9c3f-5d6e7f8a9b0c'
+    assert _bind(dialect, None) is None
+
+
+def test_sqlite_binds_strings_unchanged():
+    """SQLite keeps String(36), so any string is compared as-is."""
+    assert _bind(sqlite.dialect(), 'missing') == 'missing'
+
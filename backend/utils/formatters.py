@@ -1,4 +1,5 @@
 """Formatting utility functions."""
+from datetime import datetime, timezone
 
 
 def format_stay_duration(minutes: int) -> str:
@@ -23,3 +24,43 @@ def format_stay_duration(minutes: int) -> str:
         return f"{hours}h"
     else:
         return f"{hours}h {remaining_minutes}m"
+
+
+def format_utc_iso(dt):
+    """
+    Format a naive UTC datetime as an ISO 8601 string with a 'Z' suffix.
+    
+    Args:
+        dt: Naive datetime in UTC, or None
+        
+    Returns:
+        String like "2026-02-16T09:30:00Z", or None if dt is None
+    """
+    if dt is None:
+        return None
+    return dt.isoformat() + 'Z'
+
+
+def parse_utc_iso(value):
+    """
+    Parse an ISO 8601 timestamp from a client into a naive UTC datetime.
+    
+    Inverse of format_utc_iso. Accepts a trailing 'Z' or an explicit offset
+    (converted to UTC); naive input is taken as UTC already.
+    
+    Args:
+        value: ISO 8601 string, e.g. "2026-02-16T09:30:00Z"
+        
+    Returns:
+        Naive UTC datetime, or None for empty or malformed input
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        # Strip 'Z' by slicing (fromisoformat before 3.11 rejects it)
+        parsed = datetime.fromisoformat(value[:-1] if value.endswith('Z') else value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
@@ -0,0 +1,145 @@
+"""Short-lived in-process cache for read-heavy JSON endpoints and list totals."""
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, request
+
+DEFAULT_TTL_SECONDS = 60
+COUNT_TTL_SECONDS = 30
+
+# Per-member count keys and per-page list keys accumulate, so the cache is
+# capped; a full cache first sheds expired entries, then the oldest ones
+MAX_ENTRIES = 512
+
+# A successful request with one of these methods to a blueprint passed to
+# init_app() may have changed the data behind a cached response, so it drops
+# every entry
+_WRITE_METHODS = frozenset(('POST', 'PUT', 'PATCH', 'DELETE'))
+
+_lock = threading.Lock()
+
+
+def _entries():
+    """Return the current app's cache dict (one per app, so tests never share)."""
+    return current_app.extensions.setdefault('response_cache', {})
+
+
+def _store(entries, key, entry, now):
+    """Store ``entry`` (expiry first) under ``key``, evicting to stay under MAX_ENTRIES."""
+    with _lock:
+        entries.pop(key, None)
+        if len(entries) >= MAX_ENTRIES:
+            for stale in [k for k, v in entries.items() if v[0] <= now]:
+                del entries[stale]
+        while len(entries) >= MAX_ENTRIES:
+            del entries[next(iter(entries))]
+        entries[key] = entry
+
+
+def cached_json(key, ttl=DEFAULT_TTL_SECONDS, vary_on=()):
+    """
+    Cache a view's successful JSON response body for ``ttl`` seconds.
+
+    Place below the auth decorator so access checks still run on every request.
+    Only 200 responses are stored; errors always fall through to the view.
+    Stored responses carry an ETag and ``Cache-Control: private, no-cache``,
+    so a client revalidating with If-None-Match gets a bodyless 304 while
+    the data is unchanged.
+
+    Args:
+        key: Cache key, e.g. 'admin:dash:metrics'
+        ttl: Seconds an entry stays fresh
+        vary_on: Query parameters the view reads (for paginated or filtered
+            lists); one entry is stored per combination of their values and
+            any other parameter, such as a cache-busting timestamp, is
+            ignored. ``key`` stays the invalidation prefix
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            entry_key = key
+            if vary_on:
+                entry_key += '?' + '&'.join(f"{name}={request.args.get(name, '')}" for name in vary_on)
+            entries = _entries()
+            now = time.monotonic()
+            with _lock:
+                entry = entries.get(entry_key)
+            if entry is not None and now < entry[0]:
+                response = current_app.response_class(entry[1], status=200, mimetype='application/json')
+                response.set_etag(entry[2])
+                return _conditional(response)
+
+            rv = view(*args, **kwargs)
+            response = current_app.make_response(rv)
+            if response.status_code == 200 and response.is_json:
+                response.add_etag()
+                _store(entries, entry_key, (now + ttl, response.get_data(), response.get_etag()[0]), now)
+                return _conditional(response)
+            return response
+        return wrapper
+    return decorator
+
+
+def cached_count(key, query, refresh=False, ttl=COUNT_TTL_SECONDS):
+    """
+    Return the row count of ``query``, reusing a stored count for ``ttl`` seconds.
+
+    Stored counts are dropped after successful writes, like cached responses.
+
+    Args:
+        key: Cache key naming the list and its filters, e.g. 'count:transactions:PENDING:'
+        query: Query to count (its ORDER BY is dropped for the count)
+        refresh: Recount and store even if a fresh count exists
+        ttl: Seconds a count stays fresh
+    """
+    entries = _entries()
+    now = time.monotonic()
+    if not refresh:
+        with _lock:
+            entry = entries.get(key)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+    total = query.order_by(None).count()
+    _store(entries, key, (now + ttl, total), now)
+    return total
+
+
+def _conditional(response):
+    """Make ``response`` revalidate-only; 304 it when the client's ETag matches."""
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def invalidate(prefix=''):
+    """Drop cached responses whose key starts with ``prefix`` (all by default)."""
+    entries = _entries()
+    with _lock:
+        for key in [k for k in entries if k.startswith(prefix)]:
+            del entries[key]
+
+
+def _invalidate_after_write(response):
+    if (
+        request.method in _WRITE_METHODS
+        and response.status_code < 400
+        and request.blueprint in current_app.extensions['response_cache_blueprints']
+    ):
+        invalidate()
+    return response
+
+
+def init_app(app, blueprints):
+    """
+    Register the hook that clears the cache after successful writes.
+
+    Args:
+        app: Flask app
+        blueprints: Names of the blueprints whose writes can change cached
+            data; writes elsewhere (logins, attendance sync) keep the cache
+    """
+    app.extensions.setdefault('response_cache', {})
+    app.extensions['response_cache_blueprints'] = frozenset(blueprints)
+    app.after_request(_invalidate_after_write)
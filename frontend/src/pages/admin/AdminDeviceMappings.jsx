@@ -69,7 +69,7 @@ const AdminDeviceMappings = () => {
   const fetchTrainers = async () => {
     try {
       const token = localStorage.getItem('token');
-      const res = await fetch('/api/admin/trainers?limit=1000', {
+      const res = await fetch('/api/admin/trainers?limit=1000&count=false&fields=full_name', {
         headers: { Authorization: `Bearer ${token}` }
       });
       if (res.ok) {
@@ -103,7 +103,7 @@ export default function AdminMembers() {
 
   const fetchTrainers = async () => {
     try {
-      const response = await apiClient.get('/admin/trainers')
+      const response = await apiClient.get('/admin/trainers', { params: { count: false, fields: 'full_name,specialization,salary_rate' } })
       setTrainers(response.data.trainers || [])
     } catch (err) {
       console.error('Failed to load trainers:', err)
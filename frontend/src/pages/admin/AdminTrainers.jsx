@@ -42,7 +42,7 @@ export default function AdminTrainers() {
 
   const fetchTrainers = async () => {
     try {
-      const response = await apiClient.get('/admin/trainers-fixed')
+      const response = await apiClient.get('/admin/trainers-fixed', { params: { count: false } })
       setTrainers(response.data.trainers || [])
     } catch (err) {
       setError('Failed to load trainers')